@@ -35,13 +35,12 @@ Implementation Notes
 
 import struct
 import time
+from array import array
 
 from adafruit_bus_device.i2c_device import I2CDevice
 from adafruit_register.i2c_bit import ROBit, RWBit
-
-# from adafruit_register.i2c_struct   import UnaryStruct
 from adafruit_register.i2c_bits import ROBits, RWBits
-from adafruit_register.i2c_struct import ROUnaryStruct
+from adafruit_register.i2c_struct import UnaryStruct
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
@@ -50,6 +49,8 @@ __repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
 _PU_CTRL = 0x00  # Power-Up Control RW
 _CTRL1 = 0x01  # Control 1 RW
 _CTRL2 = 0x02  # Control 2 RW
+_OCAL1_B2 = 0x03  # Channel 1 offset calibration [23:16]; OCAL1 and GCAL1 0x03-0x09 RW
+_OCAL2_B2 = 0x0A  # Channel 2 offset calibration [23:16]; OCAL2 and GCAL2 0x0A-0x10 RW
 _ADCO_B2 = 0x12  # ADC_OUT[23:16] R-
 _ADCO_B1 = 0x13  # ADC_OUT[16: 8] R-
 _ADCO_B0 = 0x14  # ADC_OUT[ 7: 0] R-
@@ -60,6 +61,26 @@ _PGA = 0x1B  # Programmable Gain Amplifier  RW
 _PWR_CTRL = 0x1C  # Power Control  RW
 _REV_ID = 0x1F  # Chip Revision ID  R-
 
+# Registers held in the optional shadow copy; bitmask indexed by address
+_SHADOW_REGS = (
+    (1 << _PU_CTRL) | (1 << _CTRL1) | (1 << _CTRL2) | (1 << _ADC) | (1 << _PGA) | (1 << _PWR_CTRL)
+)
+# Shadowed registers with bits changed by the chip (PUR, CR, CALS, CAL_ERR)
+_VOLATILE_REGS = (1 << _PU_CTRL) | (1 << _CTRL2)
+
+# Bytes in a channel's offset plus gain calibration register bank
+_CAL_BANK_SIZE = 7
+
+# Stale conversions to discard after a channel change, keyed by rate (SPS)
+_SETTLE_DISCARD = {10: 1, 20: 1, 40: 2, 80: 2, 320: 4}
+
+# Chip calibration register blob: magic, then (channel, gain, rate, bank)
+_CAL_MAGIC = b"N7R1"
+_CAL_RECORD = "<BBH7s"
+
+# _PU_CTRL bits set after begin(): AVDDS, PUR, PUA, and PUD
+_PU_CONFIGURED = 0x8E
+
 
 class LDOVoltage:
     """Internal low-dropout voltage regulator settings."""
@@ -100,36 +121,601 @@ class CalibrationMode:
     GAIN = 0x3  # Gain   Calibration System;   _CTRL2[1:0] = 3
 
 
+# Setting lookup tables: user value to register field value
+_LDO_VOLTAGES = {"2V4": LDOVoltage.LDO_2V4, "2V7": LDOVoltage.LDO_2V7, "3V0": LDOVoltage.LDO_3V0}
+_GAINS = {
+    1: Gain.GAIN_X1,
+    2: Gain.GAIN_X2,
+    4: Gain.GAIN_X4,
+    8: Gain.GAIN_X8,
+    16: Gain.GAIN_X16,
+    32: Gain.GAIN_X32,
+    64: Gain.GAIN_X64,
+    128: Gain.GAIN_X128,
+}
+_RATES = {
+    10: ConversionRate.RATE_10SPS,
+    20: ConversionRate.RATE_20SPS,
+    40: ConversionRate.RATE_40SPS,
+    80: ConversionRate.RATE_80SPS,
+    320: ConversionRate.RATE_320SPS,
+}
+
+
+class SampleRing:
+    """Fixed-size ring buffer of signed 24-bit ADC samples with optional
+    nanosecond timestamps. Storage is preallocated; when full, the oldest
+    sample is overwritten and the overrun counter is incremented."""
+
+    def __init__(self, size=32, timestamps=False):
+        self._values = array("i", bytes(4 * size))
+        self._stamps = array("q", bytes(8 * size)) if timestamps else None
+        self._size = size
+        self._head = 0  # Next write position
+        self._count = 0
+        self.overruns = 0
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def size(self):
+        """Capacity of the ring in samples."""
+        return self._size
+
+    def put(self, value, stamp=0):
+        """Store a sample and its timestamp, overwriting the oldest sample
+        when the ring is full."""
+        self._values[self._head] = value
+        if self._stamps is not None:
+            self._stamps[self._head] = stamp
+        self._head = (self._head + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+        else:
+            self.overruns += 1
+
+    def read_into(self, buf, stamps=None):
+        """Drain up to ``len(buf)`` of the oldest samples into ``buf`` and,
+        if provided and the ring keeps timestamps, their timestamps into
+        ``stamps``. Returns the number of samples copied."""
+        count = min(len(buf), self._count)
+        tail = (self._head - self._count) % self._size
+        for i in range(count):
+            buf[i] = self._values[tail]
+            if stamps is not None and self._stamps is not None:
+                stamps[i] = self._stamps[tail]
+            tail = (tail + 1) % self._size
+        self._count -= count
+        return count
+
+    def clear(self):
+        """Discard all samples and reset the overrun counter."""
+        self._count = 0
+        self.overruns = 0
+
+
+class MovingAverage:
+    """Moving average of the last ``size`` integer samples. Keeps a running
+    sum over a preallocated window; each update is O(1)."""
+
+    def __init__(self, size=8):
+        self._window = array("i", bytes(4 * size))
+        self._size = size
+        self.reset()
+
+    def reset(self):
+        """Clear the filter history."""
+        self._index = 0
+        self._count = 0
+        self._sum = 0
+
+    def update(self, value):
+        """Add a sample and return the integer average of the window."""
+        if self._count < self._size:
+            self._count += 1
+        else:
+            self._sum -= self._window[self._index]
+        self._window[self._index] = value
+        self._sum += value
+        self._index = (self._index + 1) % self._size
+        return self._sum // self._count
+
+
+class RunningMedian:
+    """Median of the last ``size`` integer samples for spike rejection. A
+    sorted copy of the window is maintained in place, so each update costs
+    a fixed ``size``-bounded shift with no allocation."""
+
+    def __init__(self, size=5):
+        self._window = array("i", bytes(4 * size))
+        self._sorted = array("i", bytes(4 * size))
+        self._size = size
+        self.reset()
+
+    def reset(self):
+        """Clear the filter history."""
+        self._index = 0
+        self._count = 0
+
+    def update(self, value):
+        """Add a sample and return the median of the window."""
+        srt = self._sorted
+        count = self._count
+        if count < self._size:
+            self._count += 1
+        else:
+            # Remove the oldest sample from the sorted copy
+            pos = 0
+            oldest = self._window[self._index]
+            while srt[pos] != oldest:
+                pos += 1
+            while pos < count - 1:
+                srt[pos] = srt[pos + 1]
+                pos += 1
+            count -= 1
+        self._window[self._index] = value
+        self._index = (self._index + 1) % self._size
+        # Insert the new sample into the sorted copy
+        pos = count
+        while pos > 0 and srt[pos - 1] > value:
+            srt[pos] = srt[pos - 1]
+            pos -= 1
+        srt[pos] = value
+        return srt[self._count // 2]
+
+
+class ExponentialFilter:
+    """First-order IIR (exponential) filter with a smoothing factor of
+    ``1 / 2 ** shift``. Uses integer fixed-point arithmetic."""
+
+    def __init__(self, shift=3):
+        self._shift = shift
+        self.reset()
+
+    def reset(self):
+        """Clear the filter state; the next sample initializes it."""
+        self._acc = None
+
+    def update(self, value):
+        """Add a sample and return the filtered integer value."""
+        if self._acc is None:
+            self._acc = value << self._shift
+        else:
+            self._acc += value - (self._acc >> self._shift)
+        return self._acc >> self._shift
+
+
+class FilterPipeline:
+    """Chain of filter stages, e.g.
+    ``FilterPipeline(RunningMedian(5), MovingAverage(8))``. Each sample is
+    passed through the stages in order."""
+
+    def __init__(self, *stages):
+        self.stages = stages
+
+    def reset(self):
+        """Clear the history of every stage."""
+        for stage in self.stages:
+            stage.reset()
+
+    def update(self, value):
+        """Filter a sample through every stage and return the result."""
+        for stage in self.stages:
+            value = stage.update(value)
+        return value
+
+
+class ScaleCalibration:
+    """Host-side conversion of raw ADC counts to engineering units:
+    ``value = (raw - offset) * scale``."""
+
+    def __init__(self, offset=0, scale=1.0):
+        self.offset = offset
+        self.scale = scale
+
+    def tare(self, raw):
+        """Set the zero offset to a raw reading taken with no load."""
+        self.offset = raw
+
+    def span(self, raw, value):
+        """Set the scale factor from a raw reading of a known ``value``."""
+        if raw == self.offset:
+            raise ValueError("Span reading equals the zero offset")
+        self.scale = value / (raw - self.offset)
+
+    def fit(self, raws, values):
+        """Least-squares linear fit of two or more raw readings to their
+        known ``values``; sets both the offset and the scale factor."""
+        count = len(raws)
+        if count < 2 or count != len(values):
+            raise ValueError("At least two raw/value pairs are required")
+        mean_raw = sum(raws) / count
+        mean_val = sum(values) / count
+        s_xy = 0.0
+        s_xx = 0.0
+        for raw, value in zip(raws, values):
+            s_xy += (raw - mean_raw) * (value - mean_val)
+            s_xx += (raw - mean_raw) ** 2
+        if not s_xx or not s_xy:
+            raise ValueError("Raw readings do not define a slope")
+        self.scale = s_xy / s_xx
+        self.offset = round(mean_raw - mean_val / self.scale)
+
+    def convert(self, raw):
+        """Convert a raw reading to engineering units."""
+        return (raw - self.offset) * self.scale
+
+
+def _pack_records(magic, record, items):
+    """Serialize ``items``, a sequence of field tuples, as a blob: the
+    4-byte ``magic``, a uint16 count, then each item packed as ``record``."""
+    size = struct.calcsize(record)
+    blob = bytearray(6 + size * len(items))
+    blob[0:4] = magic
+    struct.pack_into("<H", blob, 4, len(items))
+    pos = 6
+    for fields in items:
+        struct.pack_into(record, blob, pos, *fields)
+        pos += size
+    return bytes(blob)
+
+
+def _unpack_records(magic, record, blob):
+    """Yield the field tuples of a blob produced by ``_pack_records()``.
+    Raises ValueError if the blob does not start with ``magic``."""
+    if bytes(blob[0:4]) != magic:
+        raise ValueError("Invalid calibration data")
+    size = struct.calcsize(record)
+    pos = 6
+    for _ in range(struct.unpack_from("<H", blob, 4)[0]):
+        yield struct.unpack_from(record, blob, pos)
+        pos += size
+
+
+class CalibrationStore:
+    """Collection of ``ScaleCalibration`` coefficients keyed by device
+    address, channel, gain, and conversion rate. Serializes to a compact
+    binary blob suitable for a file or ``microcontroller.nvm``."""
+
+    _MAGIC = b"N7C1"
+    _RECORD = "<BBBHif"  # address, channel, gain, rate, offset, scale
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        """Return the calibration for ``key``, or None."""
+        return self.entries.get(key)
+
+    def put(self, key, calibration):
+        """Store a copy of ``calibration`` under ``key``; see
+        ``NAU7802.calibration_key()``."""
+        self.entries[key] = ScaleCalibration(calibration.offset, calibration.scale)
+
+    def to_bytes(self):
+        """Serialize the store to a ``bytes`` blob."""
+        return _pack_records(
+            self._MAGIC,
+            self._RECORD,
+            [(*key, cal.offset, cal.scale) for key, cal in self.entries.items()],
+        )
+
+    @classmethod
+    def from_bytes(cls, blob):
+        """Create a store from a blob produced by ``to_bytes()``. Raises
+        ValueError if the blob is not a calibration store."""
+        store = cls()
+        for record in _unpack_records(cls._MAGIC, cls._RECORD, blob):
+            store.entries[record[0:4]] = ScaleCalibration(record[4], record[5])
+        return store
+
+    def save(self, path):
+        """Write the store to a file."""
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a store from a file."""
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class _ShadowI2CDevice:
+    """I2CDevice wrapper that keeps a shadow copy of the writable
+    configuration registers. Single-byte reads of registers without
+    chip-driven status bits are served from memory and unchanged writes are
+    skipped. While deferring, all shadowed register accesses stay in memory
+    until ``sync()`` writes each changed register once."""
+
+    def __init__(self, i2c_device):
+        self.i2c_device = i2c_device
+        self.device_address = i2c_device.device_address
+        self._shadow = bytearray(0x20)
+        self._valid = 0  # Bitmask of registers with a known value
+        self._dirty = 0  # Bitmask of registers awaiting sync()
+        self._buf = bytearray(2)
+        self.deferring = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def readinto(self, buf, *, start=0, end=None):
+        """Read from the device into a buffer."""
+        with self.i2c_device as i2c:
+            i2c.readinto(buf, start=start, end=end)
+
+    def write(self, buf, *, start=0, end=None):
+        """Write a buffer to the device, updating or deferring shadowed
+        single-register writes."""
+        end = len(buf) if end is None else end
+        reg = buf[start]
+        mask = 1 << reg if reg < 0x20 else 0
+        if end - start != 2 or not mask & _SHADOW_REGS:
+            with self.i2c_device as i2c:
+                i2c.write(buf, start=start, end=end)
+            return
+        value = buf[start + 1]
+        if self.deferring:
+            self._dirty |= mask
+        elif mask & _VOLATILE_REGS or not self._valid & mask or self._shadow[reg] != value:
+            with self.i2c_device as i2c:
+                i2c.write(buf, start=start, end=end)
+        self._shadow[reg] = value
+        self._valid |= mask
+
+    def write_then_readinto(
+        self, out_buffer, in_buffer, *, out_start=0, out_end=None, in_start=0, in_end=None
+    ):
+        """Write a register address then read its value, serving shadowed
+        single-register reads from memory where possible."""
+        in_end = len(in_buffer) if in_end is None else in_end
+        reg = out_buffer[out_start]
+        mask = 1 << reg if reg < 0x20 else 0
+        single = in_end - in_start == 1 and mask & _SHADOW_REGS
+        if single and self._valid & mask and (self.deferring or not mask & _VOLATILE_REGS):
+            in_buffer[in_start] = self._shadow[reg]
+            return
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(
+                out_buffer,
+                in_buffer,
+                out_start=out_start,
+                out_end=out_end,
+                in_start=in_start,
+                in_end=in_end,
+            )
+        if single and not self._dirty & mask:
+            self._shadow[reg] = in_buffer[in_start]
+            self._valid |= mask
+
+    def sync(self):
+        """Write every deferred register change to the device."""
+        for reg in range(0x20):
+            if self._dirty & (1 << reg):
+                self._buf[0] = reg
+                self._buf[1] = self._shadow[reg]
+                with self.i2c_device as i2c:
+                    i2c.write(self._buf)
+        self._dirty = 0
+
+    def invalidate(self):
+        """Discard the shadow copy, including any unsynced changes."""
+        self._valid = 0
+        self._dirty = 0
+
+
+class _NullLock:
+    """Context manager standing in for a lock when thread safety is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+_NULL_LOCK = _NullLock()
+
+
+class _Batch:
+    """Context manager that defers shadowed register writes until exit."""
+
+    def __init__(self, shadow):
+        self._shadow = shadow
+
+    def __enter__(self):
+        self._shadow.sync()
+        self._shadow.deferring = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._shadow.deferring = False
+        self._shadow.sync()
+        return False
+
+
+def _next_conversion(expected, checked, now, period):
+    """Schedule the conversion after one collected at ``now`` that was
+    expected at ``expected`` (0 if unknown); ``checked`` is when data was
+    last seen not ready. Returns the next expected conversion time and the
+    number of conversions overwritten before collection. The schedule
+    advances from the expected conversion time so that collection lag does
+    not accumulate, resynchronizing when the chip runs ahead of or behind
+    the schedule."""
+    if not expected:
+        return now + period, 0
+    if now < expected:
+        expected = now  # Chip ahead of schedule
+    elif checked > expected:
+        expected = checked  # Chip behind schedule
+    lost = (now - expected) // period
+    return expected + (lost + 1) * period, lost
+
+
 class NAU7802:
     """The primary NAU7802 class."""
 
-    def __init__(self, i2c_bus, address=0x2A, active_channels=1):
+    GAINS = tuple(_GAINS)  # Valid PGA gain factors
+    RATES = tuple(_RATES)  # Valid conversion rates (SPS)
+
+    def __init__(self, i2c_bus, address=0x2A, active_channels=1, reset=True, begin=True):
         """Instantiate NAU7802; LDO 3v0 volts, gain 128, 10 samples per second
         conversion rate, disabled ADC chopper clock, low ESR caps, and PGA output
-        stabilizer cap if in single channel mode."""
+        stabilizer cap if in single channel mode. If ``reset`` is None, the
+        register reset is skipped when the chip is already powered up and
+        configured. If ``begin`` is False, no device setup is performed; call
+        ``begin()`` or ``NAU7802Group.begin()`` later."""
         self.i2c_device = I2CDevice(i2c_bus, address)
-        if not self.reset():
-            raise RuntimeError("NAU7802 device could not be reset")
-        if not self.enable(True):
-            raise RuntimeError("NAU7802 device could not be enabled")
+        # Preallocated buffers for the ADCO_B2..B0 burst read
+        self._adc_reg = bytearray((_ADCO_B2,))
+        self._adc_buf = bytearray(3)
+        self._act_channels = active_channels
+        self._rate = 10
+        self._calib_mode = None  # Initialize for later use
+        self._adc_out = None  # Initialize for later use
+        self._ring = None  # Continuous acquisition buffer
+        self._drdy = None  # Optional DRDY pin for continuous acquisition
+        self._next_due = 0  # Next expected conversion time (ns)
+        self._checked = 0  # Last time a conversion was seen not ready (ns)
+        self.missed = 0  # Conversions skipped in continuous acquisition
+        self.scan_rate = 0.0  # Per-channel SPS achieved by scan_channels()
+        self.filters = None  # Optional FilterPipeline for read_filtered()
+        self._chan = 1  # Host copy of the selected channel
+        # Host copies of the chopper clock (ADC control is write-only) and
+        # PGA LDO mode; chip defaults until configured
+        self._chop = 0x0
+        self._ldo_mode = 0x0
+        self.samples = array("i")  # Default read_samples() buffer
+        self._ready_at = 0  # Time wait_ready() last saw a conversion ready (ns)
+        self.timeout_raises = False  # Raise RuntimeError on data-ready timeout
+        self._lock = _NULL_LOCK  # Per-device operation lock; see lock
+        # Chip calibration register sets keyed by (channel, gain, rate)
+        self.chip_calibrations = {}
+        self._cal_loaded = [None, None]  # Key of the set loaded per channel
+        self._cal_buf = bytearray(1 + _CAL_BANK_SIZE)
+        self._cals = (ScaleCalibration(), ScaleCalibration())
+        if begin:
+            self.begin(reset)
+
+    @property
+    def shadow_registers(self):
+        """True when a shadow copy of the PU_CTRL, CTRL1, CTRL2, ADC, PGA,
+        and PWR_CTRL registers serves configuration reads from memory."""
+        return isinstance(self.i2c_device, _ShadowI2CDevice)
+
+    @shadow_registers.setter
+    def shadow_registers(self, enable=True):
+        """Enable or disable the register shadow copy."""
+        if enable and not self.shadow_registers:
+            self.i2c_device = _ShadowI2CDevice(self.i2c_device)
+        elif not enable and self.shadow_registers:
+            self.i2c_device.sync()
+            self.i2c_device = self.i2c_device.i2c_device
+
+    def batch(self):
+        """Return a context manager that collects configuration changes and
+        writes each changed register once on exit. Requires
+        ``shadow_registers``. Status bits are not refreshed inside a batch,
+        so calibration, channel selection, and data-ready or power-up waits
+        raise RuntimeError there."""
+        if not self.shadow_registers:
+            raise RuntimeError("Register shadow not enabled")
+        return _Batch(self.i2c_device)
+
+    def _check_unbatched(self):
+        """Raise RuntimeError inside ``batch()``, where the chip-driven CR,
+        PUR, CALS, and CAL_ERR bits would come from the shadow copy."""
+        if self.shadow_registers and self.i2c_device.deferring:
+            raise RuntimeError("Not available inside batch()")
+
+    def sync(self):
+        """Write any deferred shadow register changes to the device."""
+        if self.shadow_registers:
+            self.i2c_device.sync()
+
+    def invalidate(self):
+        """Discard the shadow register copy so that the next access reads
+        the device, and forget which cached calibration register sets are
+        loaded. Use after an external reset or bus error."""
+        self._cal_loaded = [None, None]
+        if self.shadow_registers:
+            self.i2c_device.invalidate()
+
+    @property
+    def lock(self):
+        """Context manager held for the duration of each multi-step
+        operation, such as a channel switch and its ready wait; a no-op by
+        default. ``cedargrove_nau7802_threaded.thread_safe()`` installs a
+        re-entrant lock here."""
+        return self._lock
+
+    @lock.setter
+    def lock(self, lock):
+        self._lock = _NULL_LOCK if lock is None else lock
+
+    def begin(self, reset=True):
+        """Reset (optional), power up, and configure the device. If ``reset``
+        is None, the reset is skipped when the chip is already configured."""
+        with self._lock:
+            if reset is None:
+                reset = not self.configured
+            if reset and not self.reset():
+                raise RuntimeError("NAU7802 device could not be reset")
+            if not self.enable(True):
+                raise RuntimeError("NAU7802 device could not be enabled")
+            self._configure_batched()
+
+    def _configure_batched(self):
+        """Run ``_configure()``, collecting its register writes in a batch
+        when ``shadow_registers`` is enabled."""
+        if self.shadow_registers:
+            with self.batch():
+                self._configure()
+        else:
+            self._configure()
+
+    def _configure(self):
+        """Write the default LDO, gain, rate, chopper, and capacitor settings."""
         self.ldo_voltage = "3V0"  # 3.0-volt internal analog power (AVDD)
         self._pu_ldo_source = True  # Internal analog power (AVDD)
         self.gain = 128  # X128
-        self._c2_conv_rate = ConversionRate.RATE_10SPS  # 10SPS default
-        self._adc_chop_clock = 0x3  # 0x3 = Disable ADC chopper clock
-        self._pga_ldo_mode = 0x0  # 0x0 = Use low ESR capacitors
-        self._act_channels = active_channels
+        self.poll_rate = 10  # 10SPS default
+        self.chopper_clock = 0x3  # 0x3 = Disable ADC chopper clock
+        self.pga_ldo_mode = 0x0  # 0x0 = Use low ESR capacitors
         # 0x1 = Enable PGA out stabilizer cap for single channel use
         self._pc_cap_enable = 0x1
         if self._act_channels == 2:
             # 0x0 = Disable PGA out stabilizer cap for dual channel use
             self._pc_cap_enable = 0x0
-        self._calib_mode = None  # Initialize for later use
-        self._adc_out = None  # Initialize for later use
+        self._chan = self._c2_chan_select + 1  # Channel kept by a skipped reset
+
+    @property
+    def configured(self):
+        """True when the chip is powered up and using the internal LDO, as
+        left by a previous ``begin()``."""
+        return self._pu_ctrl & _PU_CONFIGURED == _PU_CONFIGURED
+
+    def _wait_power_ready(self, timeout=0.750):
+        """Poll the power-up ready (PUR) bit. Returns False if ``timeout``
+        seconds elapse first."""
+        self._check_unbatched()
+        start_check = time.monotonic()
+        while not self._pu_ready:
+            if time.monotonic() - start_check > timeout:
+                return False
+            time.sleep(0.001)
+        return True
 
     # DEFINE I2C DEVICE BITS, NYBBLES, BYTES, AND REGISTERS
     # Chip Revision  R-
     _rev_id = ROBits(4, _REV_ID, 0, 1, False)
+    # Power-Up Control register  RW
+    _pu_ctrl = RWBits(8, _PU_CTRL, 0, 1, False)
     # Register Reset  (RR)  RW
     _pu_reg_reset = RWBit(_PU_CTRL, 0, 1, False)
     # Power-Up Digital Circuit  (PUD) RW
@@ -144,6 +730,10 @@ class NAU7802:
     _pu_cycle_ready = ROBit(_PU_CTRL, 5, 1, False)
     # Power-Up AVDD Source  (ADDS) RW
     _pu_ldo_source = RWBit(_PU_CTRL, 7, 1, False)
+    # Control_1 register  RW
+    _ctrl1 = UnaryStruct(_CTRL1, "<B")
+    # Control_2 register  RW
+    _ctrl2 = UnaryStruct(_CTRL2, "<B")
     # Control_1 Gain  (GAINS) RW
     _c1_gains = RWBits(3, _CTRL1, 0, 1, False)
     # Control_1 LDO Voltage  (VLDO) RW
@@ -158,12 +748,6 @@ class NAU7802:
     _c2_conv_rate = RWBits(3, _CTRL2, 4, 1, False)
     # Control_2 Channel Select  (CHS) RW
     _c2_chan_select = RWBit(_CTRL2, 7, 1, False)
-    # ADC Result Output  MSByte R-
-    _adc_out_2 = ROUnaryStruct(_ADCO_B2, ">B")
-    # ADC Result Output  MidSByte R-
-    _adc_out_1 = ROUnaryStruct(_ADCO_B1, ">B")
-    # ADC Result Output  LSByte R-
-    _adc_out_0 = ROUnaryStruct(_ADCO_B0, ">B")
     # ADC Chopper Clock Frequency Select  -W
     _adc_chop_clock = RWBits(2, _ADC, 4, 1, False)
     # PGA Stability/Accuracy Mode (LDOMODE) RW
@@ -178,29 +762,19 @@ class NAU7802:
 
     @property
     def channel(self):
-        """Selected channel number (1 or 2)."""
-        return self._c2_chan_select + 1
+        """Selected channel number (1 or 2), from the host copy of the
+        channel select bit."""
+        return self._chan
 
     @channel.setter
     def channel(self, chan=1):
         """Select the active channel. Valid channel numbers are 1 and 2.
         Returns True unless a cycle ready (CR) timeout occurs."""
+        with self._lock:
+            self._select_channel(chan)
 
-        self.read()  # Clear the data buffer
-
-        if chan == 1:
-            self._c2_chan_select = 0x0
-        elif chan == 2 and self._act_channels == 2:
-            self._c2_chan_select = 0x1
-        else:
-            raise ValueError("Invalid Channel Number")
-
-        # Check cycle ready flag; timeout after 1.0 sec
-        start_check = time.monotonic()
-        while not self._pu_cycle_ready:
-            if time.monotonic() - start_check > 1.0:
-                return False
-        return True
+            # Check cycle ready flag; timeout after 1.0 sec
+            return self.wait_ready(1.0)
 
     @property
     def ldo_voltage(self):
@@ -210,15 +784,11 @@ class NAU7802:
     @ldo_voltage.setter
     def ldo_voltage(self, voltage="EXTERNAL"):
         """Select the LDO Voltage. Valid voltages are '2V4', '2V7', '3V0'."""
-        if not f"LDO_{voltage}" in dir(LDOVoltage):
-            raise ValueError("Invalid LDO Voltage")
-        self._ldo_voltage = voltage
-        if self._ldo_voltage == "2V4":
-            self._c1_vldo_volts = LDOVoltage.LDO_2V4
-        elif self._ldo_voltage == "2V7":
-            self._c1_vldo_volts = LDOVoltage.LDO_2V7
-        elif self._ldo_voltage == "3V0":
-            self._c1_vldo_volts = LDOVoltage.LDO_3V0
+        with self._lock:
+            if voltage not in _LDO_VOLTAGES:
+                raise ValueError("Invalid LDO Voltage")
+            self._ldo_voltage = voltage
+            self._c1_vldo_volts = _LDO_VOLTAGES[voltage]
 
     @property
     def gain(self):
@@ -229,63 +799,120 @@ class NAU7802:
     def gain(self, factor=1):
         """Select PGA gain factor. Valid values are 1, 2, 4, 8, 16, 32, 64,
         and 128."""
-        if not f"GAIN_X{factor}" in dir(Gain):
-            raise ValueError("Invalid Gain Factor")
-        self._gain = factor
-        if self._gain == 1:
-            self._c1_gains = Gain.GAIN_X1
-        elif self._gain == 2:
-            self._c1_gains = Gain.GAIN_X2
-        elif self._gain == 4:
-            self._c1_gains = Gain.GAIN_X4
-        elif self._gain == 8:
-            self._c1_gains = Gain.GAIN_X8
-        elif self._gain == 16:
-            self._c1_gains = Gain.GAIN_X16
-        elif self._gain == 32:
-            self._c1_gains = Gain.GAIN_X32
-        elif self._gain == 64:
-            self._c1_gains = Gain.GAIN_X64
-        elif self._gain == 128:
-            self._c1_gains = Gain.GAIN_X128
+        with self._lock:
+            if factor not in _GAINS:
+                raise ValueError("Invalid Gain Factor")
+            self._gain = factor
+            self._c1_gains = _GAINS[factor]
+            self._restore_chip_calibration()
 
     @property
     def poll_rate(self):
-        """ADC conversion/polling rate."""
-        return self._c2_conv_rate
+        """ADC conversion/polling rate in samples per second."""
+        return self._rate
 
     @poll_rate.setter
     def poll_rate(self, rate=0):
         """Select polling rate. Valid values are 10, 20, 40, 80, and 320."""
-        if not f"RATE_{rate}SPS" in dir(ConversionRate):
-            raise ValueError("Invalid Conversion Rate")
-        self._rate = rate
-        if self._rate == 10:
-            self._c2_conv_rate = ConversionRate.RATE_10SPS
-        if self._rate == 20:
-            self._c2_conv_rate = ConversionRate.RATE_20SPS
-        if self._rate == 40:
-            self._c2_conv_rate = ConversionRate.RATE_40SPS
-        if self._rate == 80:
-            self._c2_conv_rate = ConversionRate.RATE_80SPS
-        if self._rate == 320:
-            self._c2_conv_rate = ConversionRate.RATE_320SPS
+        with self._lock:
+            if rate not in _RATES:
+                raise ValueError("Invalid Conversion Rate")
+            self._rate = rate
+            self._c2_conv_rate = _RATES[rate]
+            self._restore_chip_calibration()
+
+    @property
+    def settle_discard(self):
+        """Number of stale conversions to discard after a channel or gain
+        change at the current ``poll_rate``."""
+        return _SETTLE_DISCARD[self._rate]
+
+    @property
+    def calibration_mode(self):
+        """Mode of the last ``calibrate()`` call; None if not calibrated."""
+        return self._calib_mode
+
+    @property
+    def chopper_clock(self):
+        """ADC chopper clock setting; 0x3 disables the chopper. The ADC
+        control register is write-only, so the host copy is returned."""
+        return self._chop
+
+    @chopper_clock.setter
+    def chopper_clock(self, setting=0x3):
+        """Select the ADC chopper clock. Valid values are 0x0 to 0x3."""
+        if not 0x0 <= setting <= 0x3:
+            raise ValueError("Invalid Chopper Clock Setting")
+        self._adc_chop_clock = setting
+        self._chop = setting
+
+    @property
+    def pga_ldo_mode(self):
+        """PGA LDO mode: 0x0 for low ESR capacitors, 0x1 for high ESR."""
+        return self._ldo_mode
+
+    @pga_ldo_mode.setter
+    def pga_ldo_mode(self, mode=0x0):
+        """Select the PGA LDO mode. Valid values are 0x0 and 0x1."""
+        if mode not in {0x0, 0x1}:
+            raise ValueError("Invalid PGA LDO Mode")
+        self._pga_ldo_mode = mode
+        self._ldo_mode = mode
+
+    def apply(self, gain=None, rate=None, ldo=None, channel=None):
+        """Validate and apply several settings at once: PGA ``gain`` factor,
+        conversion ``rate`` in samples per second, ``ldo`` voltage string,
+        and ``channel`` number. All arguments are checked before any
+        register is changed; CTRL1 and CTRL2 are then each read and written
+        at most once. Conversions following a channel change are stale;
+        see ``read_pair()``."""
+        with self._lock:
+            if gain is not None and gain not in _GAINS:
+                raise ValueError("Invalid Gain Factor")
+            if rate is not None and rate not in _RATES:
+                raise ValueError("Invalid Conversion Rate")
+            if ldo is not None and ldo not in _LDO_VOLTAGES:
+                raise ValueError("Invalid LDO Voltage")
+            if channel not in {None, 1, 2} or channel == 2 and self._act_channels != 2:
+                raise ValueError("Invalid Channel Number")
+            if gain is not None or ldo is not None:
+                ctrl1 = old = self._ctrl1
+                if gain is not None:
+                    ctrl1 = (ctrl1 & ~0x07) | _GAINS[gain]
+                    self._gain = gain
+                if ldo is not None:
+                    ctrl1 = (ctrl1 & ~0x38) | (_LDO_VOLTAGES[ldo] << 3)
+                    self._ldo_voltage = ldo
+                if ctrl1 != old:
+                    self._ctrl1 = ctrl1
+            if rate is not None or channel is not None:
+                ctrl2 = old = self._ctrl2
+                if rate is not None:
+                    ctrl2 = (ctrl2 & ~0x70) | (_RATES[rate] << 4)
+                    self._rate = rate
+                if channel is not None:
+                    ctrl2 = (ctrl2 & ~0x80) | ((channel - 1) << 7)
+                    self._chan = channel
+                if ctrl2 != old:
+                    self._ctrl2 = ctrl2 & ~0x04  # Never restart a calibration
+            self._restore_chip_calibration()
 
     def enable(self, power=True):
         """Enable(start) or disable(stop) the internal analog and digital
         systems power. Enable = True; Disable (low power) = False. Returns
         True when enabled; False when disabled."""
-        self._enable = power
-        if self._enable:
-            self._pu_analog = True
-            self._pu_digital = True
-            time.sleep(0.750)  # Wait 750ms; minimum 400ms
-            self._pu_start = True  # Start acquisition system cycling
-            return self._pu_ready
-        self._pu_analog = False
-        self._pu_digital = False
-        time.sleep(0.010)  # Wait 10ms (200us minimum)
-        return False
+        with self._lock:
+            self._enable = power
+            if self._enable:
+                self._pu_analog = True
+                self._pu_digital = True
+                ready = self._wait_power_ready(0.750)  # Poll PUR; 750ms timeout
+                self._pu_cycle_start = True  # Start acquisition system cycling
+                return ready
+            self._pu_analog = False
+            self._pu_digital = False
+            time.sleep(0.010)  # Wait 10ms (200us minimum)
+            return False
 
     def available(self):
         """Read the ADC data-ready status. True when data is available; False when
@@ -293,31 +920,324 @@ class NAU7802:
         return self._pu_cycle_ready
 
     def read(self):
-        """Reads the 24-bit ADC data. Returns a signed integer value with
+        """Reads the 24-bit ADC data. Returns a signed float value with
         24-bit resolution. Assumes that the ADC data-ready bit was checked
-        to be True."""
-        adc = self._adc_out_2 << 24  # [31:24] << MSByte
-        adc = adc | (self._adc_out_1 << 16)  # [23:16] << MidSByte
-        adc = adc | (self._adc_out_0 << 8)  # [15: 8] << LSByte
-        adc = adc.to_bytes(4, "big")  # Pack to 4-byte (32-bit) structure
-        value = struct.unpack(">i", adc)[0]  # Unpack as 4-byte signed integer
+        to be True. Use ``read_samples()`` for raw integer samples."""
+        value = self._read_raw() << 8  # Align to [31: 8] as a 32-bit value
         self._adc_out = value / 128  # Restore to 24-bit signed integer value
         return self._adc_out
 
+    def read_samples(self, count, out=None, timeout=1.0):
+        """Capture ``count`` consecutive conversions as raw signed 24-bit
+        integers into ``out``, an ``array('i')`` or ``memoryview``, waiting
+        for data-ready before each sample. If ``out`` is None, the reusable
+        ``samples`` array is used, growing as needed. Returns the number of
+        samples captured, which is less than ``count`` on timeout."""
+        with self._lock:
+            if out is None:
+                if len(self.samples) < count:
+                    self.samples = array("i", bytes(4 * count))
+                out = self.samples
+            elif len(out) < count:
+                raise ValueError("Output buffer too small")
+            for i in range(count):
+                if not self.wait_ready(timeout):
+                    return i
+                out[i] = self._read_raw()
+            return count
+
+    def _read_raw(self):
+        """Read ADCO_B2, ADCO_B1, and ADCO_B0 in a single auto-incremented
+        I2C transaction. Returns the sign-extended 24-bit integer."""
+        buf = self._adc_buf
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._adc_reg, buf)
+        value = (buf[0] << 16) | (buf[1] << 8) | buf[2]
+        if value & 0x800000:  # Sign-extend from bit 23
+            value -= 0x1000000
+        return value
+
+    def start_continuous(self, size=32, drdy=None, timestamps=False):
+        """Begin continuous acquisition into a preallocated ring buffer of
+        ``size`` samples. If ``drdy`` is a ``DigitalInOut`` connected to the
+        DRDY pin, its level is used to detect completed conversions without
+        bus traffic; otherwise the data-ready bit is polled only once the
+        next conversion is nearly due at the current ``poll_rate``. Call
+        ``service()`` regularly to collect samples; conversions overwritten
+        before collection are counted in ``missed``."""
+        self._ring = SampleRing(size, timestamps)
+        self._drdy = drdy
+        self._next_due = 0
+        self._checked = 0
+        self.missed = 0
+        return self._ring
+
+    def stop_continuous(self):
+        """End continuous acquisition and release the ring buffer."""
+        self._ring = None
+        self._drdy = None
+
+    def service(self):
+        """Collect a completed conversion into the continuous acquisition
+        ring buffer. Returns True if a sample was captured."""
+        with self._lock:
+            if self._ring is None:
+                raise RuntimeError("Continuous acquisition not started")
+            now = time.monotonic_ns()
+            period = 1_000_000_000 // self._rate
+            if now < self._next_due - period // 8:
+                return False
+            if not (self._drdy.value if self._drdy is not None else self._pu_cycle_ready):
+                self._checked = now
+                return False
+            self._next_due, lost = _next_conversion(self._next_due, self._checked, now, period)
+            self.missed += lost
+            self._ring.put(self._read_raw(), now)
+            return True
+
+    @property
+    def overruns(self):
+        """Number of continuous acquisition samples lost to a full ring."""
+        return self._ring.overruns if self._ring is not None else 0
+
+    def read_into(self, buf, stamps=None):
+        """Drain continuous acquisition samples into ``buf`` (and optional
+        ``stamps``). Returns the number of samples copied."""
+        if self._ring is None:
+            raise RuntimeError("Continuous acquisition not started")
+        return self._ring.read_into(buf, stamps)
+
+    def read_next(self, timeout=1.0):
+        """Wait for the next conversion and return it as a raw signed 24-bit
+        integer. Returns None on timeout."""
+        with self._lock:
+            if not self.wait_ready(timeout):
+                return None
+            return self._read_raw()
+
+    def read_filtered(self, timeout=1.0):
+        """Wait for the next conversion and return the raw 24-bit sample
+        passed through the ``filters`` pipeline. Returns None on timeout."""
+        value = self.read_next(timeout)
+        if value is not None and self.filters is not None:
+            value = self.filters.update(value)
+        return value
+
+    @property
+    def calibration(self):
+        """The ``ScaleCalibration`` of the selected channel."""
+        return self._cals[self._chan - 1]
+
+    @calibration.setter
+    def calibration(self, calibration):
+        """Replace the coefficients of the selected channel, e.g. with an
+        entry restored from a ``CalibrationStore``."""
+        cal = self._cals[self._chan - 1]
+        cal.offset = calibration.offset
+        cal.scale = calibration.scale
+
+    def calibration_key(self):
+        """The ``CalibrationStore`` key for the current configuration:
+        ``(address, channel, gain, rate)``."""
+        return (self.i2c_device.device_address, self._chan, self._gain, self._rate)
+
+    def tare(self, samples=8, timeout=1.0):
+        """Re-zero the selected channel's host-side calibration from the
+        average of ``samples`` raw readings, without running the chip's
+        calibration cycle. Returns the new offset, or None on timeout."""
+        with self._lock:
+            total = 0
+            for _ in range(samples):
+                if not self.wait_ready(timeout):
+                    return None
+                total += self._read_raw()
+            self.calibration.offset = total // samples
+            return self.calibration.offset
+
+    def read_units(self, timeout=1.0):
+        """Wait for the next conversion and return it converted to
+        engineering units by the selected channel's calibration. Returns
+        None on timeout."""
+        with self._lock:
+            if not self.wait_ready(timeout):
+                return None
+            return self.calibration.convert(self._read_raw())
+
     def reset(self):
         """Resets all device registers and enables digital system power.
         Returns the power ready status bit value: True when system is ready;
         False when system not ready for use."""
-        self._pu_reg_reset = True  # Reset all registers
-        time.sleep(0.100)  # Wait 100ms; 10ms minimum
-        self._pu_reg_reset = False
-        self._pu_digital = True
-        time.sleep(0.750)  # Wait 750ms; 400ms minimum
-        return self._pu_ready
+        with self._lock:
+            self._pu_reg_reset = True  # Reset all registers
+            time.sleep(0.010)  # Wait 10ms minimum
+            self._pu_reg_reset = False
+            self.invalidate()  # Registers returned to their defaults
+            self._reset_host_copies()
+            self._pu_digital = True
+            return self._wait_power_ready(0.750)  # Poll PUR; 750ms timeout
+
+    def _reset_host_copies(self):
+        """Return the host copies of chip settings to the register defaults
+        after a register reset: gain 1, 10 SPS, channel 1, and chopper and
+        PGA LDO mode 0x0."""
+        self._gain = 1
+        self._rate = 10
+        self._chan = 1
+        self._chop = 0x0
+        self._ldo_mode = 0x0
 
     def calibrate(self, mode="INTERNAL"):
         """Perform the calibration procedure. Valid calibration modes
         are 'INTERNAL', 'OFFSET', and 'GAIN'. True if successful."""
+        with self._lock:
+            self._start_calibration(mode)
+            while self._c2_cal_start:
+                time.sleep(0.5 / self._rate)  # Half a conversion period
+            return self._finish_calibration()
+
+    def _finish_calibration(self):
+        """Check the calibration error bit and, if successful, cache the
+        selected channel's calibration registers. True if successful."""
+        if self._c2_cal_error:
+            return False
+        buf = self._cal_buf
+        buf[0] = _OCAL1_B2 if self._chan == 1 else _OCAL2_B2
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
+        key = (self._chan, self._gain, self._rate)
+        self.chip_calibrations[key] = bytes(buf[1:])
+        self._cal_loaded[self._chan - 1] = key
+        return True
+
+    def _restore_chip_calibration(self):
+        """Write the cached calibration registers for the selected channel,
+        gain, and rate in one burst, unless already loaded."""
+        key = (self._chan, getattr(self, "_gain", None), self._rate)
+        cal = self.chip_calibrations.get(key)
+        if cal is None or self._cal_loaded[self._chan - 1] == key:
+            return
+        buf = self._cal_buf
+        buf[0] = _OCAL1_B2 if self._chan == 1 else _OCAL2_B2
+        buf[1:] = cal
+        with self.i2c_device as i2c:
+            i2c.write(buf)
+        self._cal_loaded[self._chan - 1] = key
+
+    def save_chip_calibrations(self):
+        """Serialize ``chip_calibrations`` to a ``bytes`` blob for a file or
+        ``microcontroller.nvm``."""
+        return _pack_records(
+            _CAL_MAGIC, _CAL_RECORD, [(*key, cal) for key, cal in self.chip_calibrations.items()]
+        )
+
+    def load_chip_calibrations(self, blob):
+        """Restore ``chip_calibrations`` from a blob produced by
+        ``save_chip_calibrations()`` and load the set matching the current
+        configuration. Raises ValueError if the blob is not valid."""
+        for chan, gain, rate, cal in _unpack_records(_CAL_MAGIC, _CAL_RECORD, blob):
+            self.chip_calibrations[chan, gain, rate] = cal
+        self._restore_chip_calibration()
+
+    def _select_channel(self, chan):
+        """Clear the data buffer and set the channel select bit."""
+        self._check_unbatched()
+        self.read()  # Clear the data buffer
+
+        if chan == 1:
+            self._c2_chan_select = 0x0
+        elif chan == 2 and self._act_channels == 2:
+            self._c2_chan_select = 0x1
+        else:
+            raise ValueError("Invalid Channel Number")
+        self._chan = chan
+        self._restore_chip_calibration()
+
+    def wait_ready(self, timeout=1.0):
+        """Wait for the ADC data-ready (CR) bit. Sleeps until shortly before
+        the next conversion is expected from the ``poll_rate`` and the time
+        the last conversion was seen ready, then polls at a fraction of the
+        conversion period. Returns True when data is ready. On timeout,
+        returns False, or raises RuntimeError if ``timeout_raises`` is
+        True."""
+        self._check_unbatched()
+        deadline = time.monotonic_ns() + int(timeout * 1_000_000_000)
+        delay = self._ready_delay()
+        if delay:
+            time.sleep(min(delay, timeout))
+        while not self._pu_cycle_ready:
+            if time.monotonic_ns() > deadline:
+                return self._ready_timeout()
+            time.sleep(0.0625 / self._rate)
+        self._ready_at = time.monotonic_ns()
+        return True
+
+    def _ready_delay(self):
+        """Seconds until the next conversion is nearly due; 0 if it is due."""
+        period = 1_000_000_000 // self._rate
+        early = self._ready_at + period - period // 8 - time.monotonic_ns()
+        return early / 1_000_000_000 if 0 < early <= period else 0
+
+    def _ready_timeout(self):
+        """Report a data-ready timeout as configured by ``timeout_raises``."""
+        if self.timeout_raises:
+            raise RuntimeError("NAU7802 data ready timeout")
+        return False
+
+    def _settled_read(self, chan, discard, timeout):
+        """Switch to ``chan`` if needed, discard the stale conversions, and
+        return the next raw sample; None on timeout."""
+        if self._chan != chan:  # Host copy; avoids a CTRL2 read per sample
+            self._c2_chan_select = chan - 1
+            self._chan = chan
+            self._restore_chip_calibration()
+            for _ in range(discard):
+                if not self.wait_ready(timeout):
+                    return None
+                self._read_raw()
+        if not self.wait_ready(timeout):
+            return None
+        return self._read_raw()
+
+    def read_pair(self, discard=None, timeout=1.0):
+        """Read one settled raw sample from channel 1 and then channel 2.
+        ``discard`` is the number of conversions thrown away after each
+        channel change; by default it depends on ``poll_rate``. Returns a
+        ``(ch1, ch2)`` tuple of signed 24-bit integers, or None on timeout.
+        Requires ``active_channels=2``."""
+        with self._lock:
+            if self._act_channels != 2:
+                raise ValueError("Invalid Channel Number")
+            if discard is None:
+                discard = self.settle_discard
+            ch1 = self._settled_read(1, discard, timeout)
+            if ch1 is None:
+                return None
+            ch2 = self._settled_read(2, discard, timeout)
+            if ch2 is None:
+                return None
+            return ch1, ch2
+
+    def scan_channels(self, count, out1, out2, discard=None, timeout=1.0):
+        """Alternate between channels 1 and 2, storing ``count`` paired raw
+        samples into the ``out1`` and ``out2`` arrays. Returns the number of
+        pairs captured; ``scan_rate`` reports the achieved per-channel
+        samples per second."""
+        with self._lock:
+            start = time.monotonic_ns()
+            captured = 0
+            while captured < count:
+                pair = self.read_pair(discard, timeout)
+                if pair is None:
+                    break
+                out1[captured], out2[captured] = pair
+                captured += 1
+            elapsed = time.monotonic_ns() - start
+            self.scan_rate = captured * 1_000_000_000 / elapsed if elapsed else 0.0
+            return captured
+
+    def _start_calibration(self, mode):
+        """Set the calibration mode and start the calibration cycle."""
+        self._check_unbatched()
         if not mode in dir(CalibrationMode):
             raise ValueError("Invalid Calibration Mode")
         self._calib_mode = mode
@@ -328,6 +1248,154 @@ class NAU7802:
         elif self._calib_mode == "GAIN":  # External PGA full-scale gain setting
             self._c2_cal_mode = CalibrationMode.GAIN
         self._c2_cal_start = True
-        while self._c2_cal_start:
-            time.sleep(0.010)  # 10ms
-        return not self._c2_cal_error
+
+
+class NAU7802Group:
+    """Interleave conversions across several NAU7802 devices. Devices may be
+    on different addresses, buses, or I2C multiplexer ports. Each call to
+    ``poll()`` is a single scheduling pass that harvests every device whose
+    conversion is due and ready; ``read_frame()`` assembles one sample from
+    every device into a time-aligned frame."""
+
+    def __init__(self, devices):
+        self.devices = list(devices)
+        count = len(self.devices)
+        self._frame = array("i", bytes(4 * count))
+        self._stamps = array("q", bytes(8 * count))
+        self._due = array("q", bytes(8 * count))  # Next expected conversion
+        self._checked = array("q", bytes(8 * count))  # Last seen not ready
+        self._fresh = bytearray(count)
+        # Per-device statistics
+        self._samples = array("I", bytes(4 * count))
+        self._missed = array("I", bytes(4 * count))
+        self._lat_min = array("q", bytes(8 * count))
+        self._lat_max = array("q", bytes(8 * count))
+        self._lat_sum = array("q", bytes(8 * count))
+        self._frames = 0
+        self._started = time.monotonic_ns()
+
+    def begin(self, reset=True, timeout=0.750):
+        """Bring up every device concurrently: reset those that need it,
+        power them all up, poll their power-up ready bits together, then
+        configure them. Devices should be constructed with ``begin=False``.
+        If ``reset`` is None, already configured devices are not reset.
+        Returns True when every device powered up within ``timeout``."""
+        if reset is None:
+            needs_reset = [not dev.configured for dev in self.devices]
+        else:
+            needs_reset = [reset] * len(self.devices)
+        for dev, needed in zip(self.devices, needs_reset):
+            if needed:
+                dev._pu_reg_reset = True  # Reset all registers
+        if True in needs_reset:
+            time.sleep(0.010)  # Wait 10ms minimum
+        for dev, needed in zip(self.devices, needs_reset):
+            if needed:
+                dev._pu_reg_reset = False
+                dev.invalidate()
+                dev._reset_host_copies()
+            dev._pu_digital = True
+            dev._pu_analog = True
+        pending = list(self.devices)
+        start_check = time.monotonic()
+        while pending and time.monotonic() - start_check <= timeout:
+            pending = [dev for dev in pending if not dev._pu_ready]
+            if pending:
+                time.sleep(0.001)
+        for dev in self.devices:
+            dev._pu_cycle_start = True  # Start acquisition system cycling
+            dev._configure()
+        return not pending
+
+    def start(self):
+        """Start the conversion cycle on every device and reset the
+        statistics."""
+        for dev in self.devices:
+            dev._pu_cycle_start = True
+        self._started = time.monotonic_ns()
+        for i in range(len(self.devices)):
+            self._due[i] = 0
+            self._checked[i] = 0
+            self._fresh[i] = 0
+            self._samples[i] = 0
+            self._missed[i] = 0
+            self._lat_min[i] = 0
+            self._lat_max[i] = 0
+            self._lat_sum[i] = 0
+        self._frames = 0
+
+    def poll(self):
+        """Harvest the devices whose conversions are due and ready. Returns
+        the number of samples collected in this pass."""
+        harvested = 0
+        for i, dev in enumerate(self.devices):
+            now = time.monotonic_ns()
+            period = 1_000_000_000 // dev._rate
+            if now < self._due[i] - period // 8:
+                continue
+            if not dev.available():
+                self._checked[i] = now
+                continue
+            self._frame[i] = dev._read_raw()
+            self._stamps[i] = now
+            self._due[i], lost = _next_conversion(self._due[i], self._checked[i], now, period)
+            self._missed[i] += lost
+            self._fresh[i] = 1
+            self._samples[i] += 1
+            harvested += 1
+        return harvested
+
+    def take(self, index):
+        """Return device ``index``'s newest ``(sample, monotonic_ns)`` pair
+        and mark it consumed, or None if it has no new sample."""
+        if not self._fresh[index]:
+            return None
+        self._fresh[index] = 0
+        return self._frame[index], self._stamps[index]
+
+    def schedule(self, index, due):
+        """Set the expected time (``monotonic_ns``) of device ``index``'s
+        next conversion; polling starts shortly before it."""
+        self._due[index] = due
+
+    def read_frame(self, timeout=1.0):
+        """Poll until every device has a new sample. Returns a tuple of the
+        raw sample array and its per-device ``monotonic_ns`` timestamp array,
+        or None if ``timeout`` seconds elapse first. The arrays are reused
+        by the next call."""
+        deadline = time.monotonic_ns() + int(timeout * 1_000_000_000)
+        while 0 in self._fresh:
+            if time.monotonic_ns() > deadline:
+                return None
+            self.poll()
+        done = time.monotonic_ns()
+        for i in range(len(self.devices)):
+            latency = done - self._stamps[i]
+            if not self._frames or latency < self._lat_min[i]:
+                self._lat_min[i] = latency
+            self._lat_max[i] = max(self._lat_max[i], latency)
+            self._lat_sum[i] += latency
+            self._fresh[i] = 0
+        self._frames += 1
+        return self._frame, self._stamps
+
+    def stats(self):
+        """Per-device throughput and frame latency statistics. Returns a list
+        of dictionaries with the device address, sample count, conversions
+        missed (overwritten before collection), samples per second, and
+        minimum/mean/maximum latency in seconds from sample capture to frame
+        completion."""
+        elapsed = max(time.monotonic_ns() - self._started, 1) / 1_000_000_000
+        frames = max(self._frames, 1)
+        return [
+            {
+                "address": dev.i2c_device.device_address,
+                "samples": self._samples[i],
+                "missed": self._missed[i],
+                "sps": self._samples[i] / elapsed,
+                "latency_min": self._lat_min[i] / 1_000_000_000,
+                "latency_mean": self._lat_sum[i] / frames / 1_000_000_000,
+                "latency_max": self._lat_max[i] / 1_000_000_000,
+            }
+            for i, dev in enumerate(self.devices)
+        ]
@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 agent
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cedargrove_nau7802_align`
+================================================================================
+
+Alignment of several NAU7802 sample streams onto a common sample clock.
+
+
+* Author(s): agent
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* ``cedargrove_nau7802``
+"""
+
+import time
+from array import array
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
+
+
+class ClockAligner:
+    """Resample the streams of a ``NAU7802Group`` onto one common sample
+    clock. Each device's internal oscillator drifts from its nominal rate,
+    so conversions from different devices are not simultaneous. Every
+    harvested sample is timestamped on the host and fed to a per-device
+    alpha-beta tracker estimating the true conversion period and phase,
+    which smooths out harvest jitter and skips over missed conversions.
+    Each device is polled again just before its predicted conversion.
+    The last ``depth`` samples of each device are kept on the estimated
+    time base and linearly interpolated at each tick of the output clock.
+    A frame is emitted as soon as every device has a sample at or after
+    the tick, so latency stays within about one conversion period; ticks
+    that fall out of the retained history are skipped and counted in
+    ``dropped``. The aligner consumes the group's samples, so do not mix
+    it with ``group.read_frame()``."""
+
+    def __init__(self, group, rate=None, depth=4, alpha=0.05, beta=0.002):
+        self.group = group
+        self.alpha = alpha
+        self.beta = beta
+        self.dropped = 0
+        count = len(group.devices)
+        self._depth = depth
+        self._period = array("q", bytes(8 * count))  # Estimated, nanoseconds
+        self._phase = array("q", bytes(8 * count))  # Estimated last conversion time
+        self._times = array("q", bytes(8 * count * depth))
+        self._values = array("i", bytes(4 * count * depth))
+        self._head = array("I", bytes(4 * count))  # Newest entry per device
+        self._count = array("I", bytes(4 * count))
+        self._frame = array("i", bytes(4 * count))
+        self._rate = rate or group.devices[0].poll_rate
+        self._tick = None  # Next output time, set once every device reports
+
+    @property
+    def rates(self):
+        """Estimated true conversion rate of each device in samples per
+        second; 0 until a device has reported two samples."""
+        return [1_000_000_000 / period if period else 0 for period in self._period]
+
+    def reset(self):
+        """Discard the sample history and rate estimates."""
+        for i in range(len(self._period)):
+            self._period[i] = 0
+            self._count[i] = 0
+        self._tick = None
+        self.dropped = 0
+
+    def _track(self, i, stamp):
+        """Update device ``i``'s period and phase estimate with a host
+        timestamp and return the estimated conversion time."""
+        period = self._period[i]
+        if not period:
+            self._period[i] = 1_000_000_000 // self.group.devices[i].poll_rate
+            self._phase[i] = stamp
+            return stamp
+        steps = max(1, round((stamp - self._phase[i]) / period))  # Missed conversions
+        predicted = self._phase[i] + steps * period
+        error = stamp - predicted
+        self._phase[i] = predicted + int(self.alpha * error)
+        self._period[i] = period + int(self.beta * error / steps)
+        return self._phase[i]
+
+    def _put(self, i, value, stamp):
+        depth = self._depth
+        head = (self._head[i] + 1) % depth
+        self._head[i] = head
+        self._times[i * depth + head] = self._track(i, stamp)
+        self._values[i * depth + head] = value
+        self._count[i] = min(self._count[i] + 1, depth)
+        # Schedule the group's next poll from the tracked conversion time
+        self.group.schedule(i, self._phase[i] + self._period[i])
+
+    def poll(self):
+        """Harvest due devices into the per-device histories. Returns the
+        number of samples collected in this pass."""
+        group = self.group
+        harvested = group.poll()
+        if harvested:
+            for i in range(len(group.devices)):
+                sample = group.take(i)
+                if sample is not None:
+                    self._put(i, *sample)
+        return harvested
+
+    def _bounds(self, i):
+        """Oldest and newest retained sample times of device ``i``."""
+        depth = self._depth
+        head = self._head[i]
+        oldest = (head - self._count[i] + 1) % depth
+        return self._times[i * depth + oldest], self._times[i * depth + head]
+
+    def _interpolate(self, i, tick):
+        depth = self._depth
+        base = i * depth
+        newer = self._head[i]
+        for _ in range(self._count[i] - 1):
+            older = (newer - 1) % depth
+            start = self._times[base + older]
+            if start <= tick:
+                end = self._times[base + newer]
+                low = self._values[base + older]
+                span = end - start
+                return (
+                    low + (self._values[base + newer] - low) * (tick - start) // span
+                    if span
+                    else low
+                )
+            newer = older
+        return self._values[base + newer]
+
+    def _ready(self):
+        """True when every device has a sample at or after the next tick,
+        skipping ticks that predate any device's retained history."""
+        if 0 in self._count:
+            return False
+        period = 1_000_000_000 // self._rate
+        bounds = [self._bounds(i) for i in range(len(self._count))]
+        oldest = max(bound[0] for bound in bounds)
+        if self._tick is None:
+            self._tick = oldest
+        elif self._tick < oldest:
+            skipped = -(-(oldest - self._tick) // period)
+            self._tick += skipped * period
+            self.dropped += skipped
+        return all(bound[1] >= self._tick for bound in bounds)
+
+    def read_frame(self, timeout=1.0):
+        """Poll until the next tick of the common clock can be interpolated
+        from every device. Returns a tuple of the raw sample array and the
+        tick time in ``monotonic_ns``, or None if ``timeout`` seconds elapse
+        first. The array is reused by the next call."""
+        deadline = time.monotonic_ns() + int(timeout * 1_000_000_000)
+        while not self._ready():
+            if time.monotonic_ns() > deadline:
+                return None
+            self.poll()
+        tick = self._tick
+        for i in range(len(self._frame)):
+            self._frame[i] = self._interpolate(i, tick)
+        self._tick = tick + 1_000_000_000 // self._rate
+        return self._frame, tick
@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 agent
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cedargrove_nau7802_async`
+================================================================================
+
+Awaitable power-up, calibration, channel selection, and read methods for the
+NAU7802 driver. Kept separate from ``cedargrove_nau7802`` so that synchronous
+users do not load the asyncio library.
+
+
+* Author(s): agent
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit's asyncio library: https://github.com/adafruit/Adafruit_CircuitPython_asyncio
+* ``cedargrove_nau7802``
+"""
+
+import asyncio
+import time
+
+from cedargrove_nau7802 import NAU7802
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
+
+
+class NAU7802Async(NAU7802):
+    """``NAU7802`` with ``*_async`` methods that yield to the event loop
+    instead of blocking. Device setup is not performed by the constructor
+    unless ``begin`` is True; ``await begin_async()`` instead."""
+
+    def __init__(self, i2c_bus, address=0x2A, active_channels=1, reset=True, begin=False):
+        super().__init__(i2c_bus, address, active_channels, reset, begin)
+
+    async def begin_async(self, reset=True):
+        """Awaitable version of ``begin()``: reset (optional), power up, and
+        configure the device. If ``reset`` is None, the reset is skipped
+        when the chip is already configured."""
+        if reset is None:
+            reset = not self.configured
+        if reset and not await self.reset_async():
+            raise RuntimeError("NAU7802 device could not be reset")
+        if not await self.enable_async(True):
+            raise RuntimeError("NAU7802 device could not be enabled")
+        self._configure_batched()
+
+    async def enable_async(self, power=True):
+        """Awaitable version of ``enable()`` that yields to the event loop
+        during the power-up and power-down delays."""
+        self._enable = power
+        if self._enable:
+            self._pu_analog = True
+            self._pu_digital = True
+            ready = await self._wait_power_ready_async(0.750)
+            self._pu_cycle_start = True  # Start acquisition system cycling
+            return ready
+        self._pu_analog = False
+        self._pu_digital = False
+        await asyncio.sleep(0.010)  # Wait 10ms (200us minimum)
+        return False
+
+    async def reset_async(self):
+        """Awaitable version of ``reset()``."""
+        self._pu_reg_reset = True  # Reset all registers
+        await asyncio.sleep(0.010)  # Wait 10ms minimum
+        self._pu_reg_reset = False
+        self.invalidate()  # Registers returned to their defaults
+        self._reset_host_copies()
+        self._pu_digital = True
+        return await self._wait_power_ready_async(0.750)
+
+    async def _wait_power_ready_async(self, timeout=0.750):
+        """Awaitable version of ``_wait_power_ready()``."""
+        self._check_unbatched()
+        start_check = time.monotonic()
+        while not self._pu_ready:
+            if time.monotonic() - start_check > timeout:
+                return False
+            await asyncio.sleep(0.001)
+        return True
+
+    async def calibrate_async(self, mode="INTERNAL"):
+        """Awaitable version of ``calibrate()``."""
+        self._start_calibration(mode)
+        while self._c2_cal_start:
+            await asyncio.sleep(0.5 / self._rate)  # Half a conversion period
+        return self._finish_calibration()
+
+    async def set_channel_async(self, chan=1):
+        """Awaitable version of the ``channel`` setter. Returns True unless
+        a cycle ready (CR) timeout occurs."""
+        self._select_channel(chan)
+        return await self.wait_ready_async(1.0)
+
+    async def wait_ready_async(self, timeout=1.0):
+        """Awaitable version of ``wait_ready()``."""
+        self._check_unbatched()
+        deadline = time.monotonic_ns() + int(timeout * 1_000_000_000)
+        delay = self._ready_delay()
+        if delay:
+            await asyncio.sleep(min(delay, timeout))
+        while not self._pu_cycle_ready:
+            if time.monotonic_ns() > deadline:
+                return self._ready_timeout()
+            await asyncio.sleep(0.0625 / self._rate)
+        self._ready_at = time.monotonic_ns()
+        return True
+
+    async def read_async(self, timeout=1.0):
+        """Wait for and read the next ADC conversion without blocking the
+        event loop. Returns None if ``timeout`` seconds elapse first."""
+        if not await self.wait_ready_async(timeout):
+            return None
+        return self.read()
+
+    async def run_continuous(self):
+        """Service continuous acquisition from an asyncio task until
+        ``stop_continuous()`` is called."""
+        while self._ring is not None:
+            self.service()
+            await asyncio.sleep(0.5 / self._rate)
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 agent
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cedargrove_nau7802_autorange`
+================================================================================
+
+Automatic PGA gain selection for the NAU7802 driver.
+
+
+* Author(s): agent
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* ``cedargrove_nau7802``
+"""
+
+from cedargrove_nau7802 import ScaleCalibration
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
+
+
+class AutoRange:
+    """Automatic PGA gain selection driven by the sample stream. After
+    ``count`` consecutive readings above ``high`` or below ``low`` (as
+    fractions of 24-bit full scale), the gain is changed to the highest
+    setting that keeps the signal below ``high``. Host-side calibration
+    coefficients are cached per gain, so a switch costs only the stale
+    conversions that follow it. Readings are reported normalized to gain
+    128 counts so that they are comparable across gain changes."""
+
+    FULL_SCALE = 0x7FFFFF
+
+    def __init__(self, nau7802, high=0.8, low=0.2, count=4):
+        if not 0 < low < high / 2 < 0.5:
+            raise ValueError("low must be less than half of high")
+        self.nau7802 = nau7802
+        self.high = int(high * self.FULL_SCALE)
+        self.low = int(low * self.FULL_SCALE)
+        self.count = count
+        self.calibrations = {}  # ScaleCalibration cache keyed by gain
+        self._outside = 0
+        self._discard = 0
+
+    def _select(self, raw):
+        """Return the highest gain keeping ``raw`` below the high limit."""
+        gain = self.nau7802.gain
+        magnitude = abs(raw)
+        if magnitude >= self.FULL_SCALE:  # Clipped; magnitude unknown
+            return max(gain // 2, 1)
+        best = 1
+        for factor in self.nau7802.GAINS:
+            if magnitude * factor < self.high * gain:
+                best = max(best, factor)
+        return best
+
+    def _switch(self, gain):
+        nau7802 = self.nau7802
+        old = nau7802.gain
+        calibration = nau7802.calibration
+        self.calibrations[old] = ScaleCalibration(calibration.offset, calibration.scale)
+        cached = self.calibrations.get(gain)
+        if cached is None:  # Estimate from the current gain's coefficients
+            cached = ScaleCalibration(
+                calibration.offset * gain // old, calibration.scale * old / gain
+            )
+        nau7802.gain = gain
+        nau7802.calibration = cached
+        self._discard = nau7802.settle_discard
+
+    def update(self, raw):
+        """Add a raw reading; returns it normalized to gain 128 counts, or
+        None while discarding stale conversions after a gain change."""
+        if self._discard:
+            self._discard -= 1
+            return None
+        gain = self.nau7802.gain
+        magnitude = abs(raw)
+        if (magnitude > self.high and gain > 1) or (magnitude < self.low and gain < 128):
+            self._outside += 1
+            if self._outside >= self.count:
+                self._outside = 0
+                target = self._select(raw)
+                if target != gain:
+                    self._switch(target)
+        else:
+            self._outside = 0
+        return raw * (128 // gain)
+
+    def read(self, timeout=1.0):
+        """Wait for the next conversion and return its normalized value; None
+        on timeout or while settling."""
+        raw = self.nau7802.read_next(timeout)
+        return None if raw is None else self.update(raw)
@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 agent
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cedargrove_nau7802_dutycycle`
+================================================================================
+
+Duty-cycled burst sampling for battery-powered NAU7802 applications.
+
+
+* Author(s): agent
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* ``cedargrove_nau7802``
+"""
+
+import time
+from array import array
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
+
+
+class DutyCycle:
+    """Duty-cycled sampling for battery operation. Every ``interval``
+    seconds the device is powered up (polling the power-up ready bit rather
+    than waiting a fixed delay), ``discard`` settling conversions are
+    dropped (by default depending on ``poll_rate``), a burst of ``burst``
+    raw samples is captured into ``samples``, and the device is powered
+    down again. ``latency`` and ``active`` record the last wake-to-first-
+    sample and total powered-up times in nanoseconds."""
+
+    def __init__(self, nau7802, burst=4, interval=60.0, discard=None):
+        self.nau7802 = nau7802
+        self.burst = burst
+        self.interval = interval
+        self.discard = discard
+        self.samples = array("i", bytes(4 * burst))
+        self.latency = 0
+        self.active = 0
+        self._next = time.monotonic_ns()
+
+    def run_once(self, timeout=1.0):
+        """Wake the device, capture one burst, and power it down. Returns
+        the number of samples captured."""
+        nau7802 = self.nau7802
+        start = time.monotonic_ns()
+        captured = 0
+        if nau7802.enable(True):
+            discard = self.discard
+            if discard is None:
+                discard = nau7802.settle_discard
+            for _ in range(discard):
+                if nau7802.read_next(timeout) is None:
+                    break
+            else:
+                captured = nau7802.read_samples(1, self.samples, timeout)
+                self.latency = time.monotonic_ns() - start
+                if captured:
+                    captured += nau7802.read_samples(
+                        self.burst - 1, memoryview(self.samples)[1:], timeout
+                    )
+        nau7802.enable(False)
+        self.active = time.monotonic_ns() - start
+        return captured
+
+    def poll(self, timeout=1.0):
+        """Run a burst if one is due. Returns the number of samples captured,
+        or None if no burst was due. Intervals missed while the scheduler was
+        behind are skipped rather than run back to back."""
+        now = time.monotonic_ns()
+        if now < self._next:
+            return None
+        interval = int(self.interval * 1_000_000_000)
+        self._next += interval
+        if self._next <= now and interval:
+            self._next += ((now - self._next) // interval + 1) * interval  # Next boundary
+        return self.run_once(timeout)
+
+    def run(self, callback, cycles=None, timeout=1.0):
+        """Sleep between bursts and call ``callback(samples, count)`` after
+        each one; runs ``cycles`` bursts, or forever if None."""
+        while cycles is None or cycles > 0:
+            delay = (self._next - time.monotonic_ns()) / 1_000_000_000
+            if delay > 0:
+                time.sleep(delay)
+            count = self.poll(timeout)
+            if count is not None:
+                callback(self.samples, count)
+                if cycles is not None:
+                    cycles -= 1
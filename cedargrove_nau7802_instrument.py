@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 agent
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cedargrove_nau7802_instrument`
+================================================================================
+
+Bus traffic and method timing statistics for the NAU7802 driver.
+
+
+* Author(s): agent
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* ``cedargrove_nau7802``
+"""
+
+import time
+from array import array
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
+
+_PU_CTRL = 0x00  # Power-Up Control RW
+_ADCO_B2 = 0x12  # ADC_OUT[23:16] R-
+
+# Methods timed by instrument(): (method name, statistics label)
+_TIMED_METHODS = (
+    ("begin", "begin"),
+    ("enable", "enable"),
+    ("reset", "reset"),
+    ("calibrate", "calibrate"),
+    ("available", "available"),
+    ("read", "read"),
+    ("read_samples", "read_samples"),
+    ("read_pair", "read_pair"),
+    ("read_filtered", "read_filtered"),
+    ("read_units", "read_units"),
+    ("tare", "tare"),
+    ("service", "service"),
+    ("_select_channel", "channel"),
+    ("wait_ready", "wait_ready"),
+)
+
+# Methods whose ADC result reads are never stale: the channel switch flushes
+# the data buffer deliberately and service() may confirm data ready through
+# the DRDY pin rather than the CR bit
+_UNCOUNTED_METHODS = ("service", "_select_channel")
+
+
+class Instrumentation:
+    """Bus traffic and timing statistics collected by ``instrument()``.
+    Counts reads and writes per register, records per-method call times
+    with a log2 histogram of microseconds, and counts stale samples: ADC
+    result reads not preceded by a CR bit read showing data ready, other
+    than channel switch flushes and DRDY pin confirmed reads.
+    ``callback(name, elapsed_ns)``, if set, is called after each timed
+    method."""
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.reads = array("I", bytes(4 * 0x20))
+        self.writes = array("I", bytes(4 * 0x20))
+        self.timings = {}
+        self.stale = 0
+        self.ready_seen = False
+        self.uncounted = 0  # Depth of calls whose ADC reads are not stale
+
+    def reset(self):
+        """Zero all counters and timings."""
+        for reg in range(0x20):
+            self.reads[reg] = 0
+            self.writes[reg] = 0
+        self.timings = {}
+        self.stale = 0
+
+    def record(self, name, elapsed):
+        """Record one call of ``name`` taking ``elapsed`` nanoseconds."""
+        timing = self.timings.get(name)
+        if timing is None:
+            # count, total, min, max, histogram
+            timing = [0, 0, elapsed, elapsed, array("I", bytes(4 * 16))]
+            self.timings[name] = timing
+        timing[0] += 1
+        timing[1] += elapsed
+        timing[2] = min(timing[2], elapsed)
+        timing[3] = max(timing[3], elapsed)
+        usec = elapsed // 1000
+        bucket = 0
+        while usec and bucket < 15:
+            usec >>= 1
+            bucket += 1
+        timing[4][bucket] += 1
+        if self.callback is not None:
+            self.callback(name, elapsed)
+
+    def timed(self, name, method, counted=True):
+        """Wrap ``method`` so each call is recorded under ``name``. ADC
+        result reads made during the call are not counted as stale unless
+        ``counted`` is True."""
+
+        def wrapper(*args, **kwargs):
+            start = time.monotonic_ns()
+            if not counted:
+                self.uncounted += 1
+            try:
+                return method(*args, **kwargs)
+            finally:
+                if not counted:
+                    self.uncounted -= 1
+                self.record(name, time.monotonic_ns() - start)
+
+        return wrapper
+
+    def snapshot(self):
+        """Return the statistics as a dictionary. Register counts are keyed
+        by register address; method times are in nanoseconds and
+        ``histogram[n]`` counts calls of less than ``2 ** n`` microseconds."""
+        return {
+            "reads": {reg: n for reg, n in enumerate(self.reads) if n},
+            "writes": {reg: n for reg, n in enumerate(self.writes) if n},
+            "methods": {
+                name: {
+                    "count": timing[0],
+                    "min": timing[2],
+                    "mean": timing[1] // timing[0],
+                    "max": timing[3],
+                    "histogram": list(timing[4]),
+                }
+                for name, timing in self.timings.items()
+            },
+            "stale": self.stale,
+        }
+
+
+class _InstrumentedI2CDevice:
+    """I2CDevice wrapper that counts register reads and writes."""
+
+    def __init__(self, i2c_device, stats):
+        self.i2c_device = i2c_device
+        self.device_address = i2c_device.device_address
+        self.stats = stats
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def readinto(self, buf, *, start=0, end=None):
+        """Read from the device into a buffer."""
+        with self.i2c_device as i2c:
+            i2c.readinto(buf, start=start, end=end)
+
+    def write(self, buf, *, start=0, end=None):
+        """Write a buffer to the device, counting register writes."""
+        end = len(buf) if end is None else end
+        with self.i2c_device as i2c:
+            i2c.write(buf, start=start, end=end)
+        for reg in range(buf[start], buf[start] + end - start - 1):
+            self.stats.writes[reg & 0x1F] += 1
+
+    def write_then_readinto(
+        self, out_buffer, in_buffer, *, out_start=0, out_end=None, in_start=0, in_end=None
+    ):
+        """Write a register address then read, counting register reads."""
+        in_end = len(in_buffer) if in_end is None else in_end
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(
+                out_buffer,
+                in_buffer,
+                out_start=out_start,
+                out_end=out_end,
+                in_start=in_start,
+                in_end=in_end,
+            )
+        stats = self.stats
+        reg = out_buffer[out_start]
+        for offset in range(in_end - in_start):
+            stats.reads[(reg + offset) & 0x1F] += 1
+        if reg == _PU_CTRL and in_buffer[in_start] & 0x20:
+            stats.ready_seen = True
+        elif reg == _ADCO_B2:
+            if not (stats.ready_seen or stats.uncounted):
+                stats.stale += 1
+            stats.ready_seen = False
+
+
+def _instrumented_holder(nau7802):
+    """Return the wrapper holding the instrumented device, or None."""
+    holder = nau7802
+    while hasattr(holder, "i2c_device"):
+        if isinstance(holder.i2c_device, _InstrumentedI2CDevice):
+            return holder
+        holder = holder.i2c_device
+    return None
+
+
+def instrument(nau7802, enable=True, callback=None):
+    """Enable or disable instrumentation of a NAU7802 device. When enabled,
+    register reads and writes are counted and the public methods are timed;
+    returns the ``Instrumentation`` object. ``callback(name, elapsed_ns)``
+    is called after each timed method. An uninstrumented device carries no
+    overhead."""
+    holder = _instrumented_holder(nau7802)
+    if enable:
+        if holder is None:
+            data = Instrumentation()
+            # The bus-level device sits beneath the optional register shadow
+            holder = nau7802.i2c_device if nau7802.shadow_registers else nau7802
+            holder.i2c_device = _InstrumentedI2CDevice(holder.i2c_device, data)
+            for name, label in _TIMED_METHODS:
+                method = getattr(nau7802, name)
+                counted = name not in _UNCOUNTED_METHODS
+                setattr(nau7802, name, data.timed(label, method, counted))
+        data = holder.i2c_device.stats
+        data.callback = callback
+        return data
+    if holder is not None:
+        holder.i2c_device = holder.i2c_device.i2c_device
+        for name, _ in _TIMED_METHODS:
+            delattr(nau7802, name)
+    return None
+
+
+def stats(nau7802):
+    """Snapshot of the instrumentation statistics plus the continuous
+    acquisition missed and overrun sample counts. Returns None if
+    instrumentation is not enabled."""
+    holder = _instrumented_holder(nau7802)
+    if holder is None:
+        return None
+    snapshot = holder.i2c_device.stats.snapshot()
+    snapshot["missed"] = nau7802.missed
+    snapshot["overruns"] = nau7802.overruns
+    return snapshot
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 agent
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cedargrove_nau7802_noise`
+================================================================================
+
+Noise and resolution characterization across NAU7802 gain, conversion
+rate, chopper clock, and PGA LDO mode settings.
+
+
+* Author(s): agent
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* ``cedargrove_nau7802``
+* ulab or numpy (optional, vectorized statistics)
+"""
+
+import math
+import time
+from array import array
+
+from cedargrove_nau7802 import NAU7802
+
+try:
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None  # Statistics fall back to plain Python loops
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
+
+
+def _block_stats(values, start):
+    """Mean, RMS noise, and peak-to-peak of ``values[start:]``."""
+    if np is not None:
+        block = np.array(values[start:])
+        return float(np.mean(block)), float(np.std(block)), float(np.max(block) - np.min(block))
+    count = len(values) - start
+    mean = sum(values[start:]) / count
+    var = sum((v - mean) ** 2 for v in values[start:]) / count
+    return mean, var**0.5, max(values[start:]) - min(values[start:])
+
+
+class NoiseSweep:
+    """Noise and resolution characterization across gain, conversion rate,
+    ADC chopper clock, and PGA LDO mode settings. For each combination a
+    block of ``samples`` raw conversions is captured. The settled second
+    half gives the RMS noise, peak-to-peak noise, and effective bits
+    (``24 - log2(rms)``). Settling time runs from the configuration change
+    to the first sample after which every reading stays within four RMS of
+    the settled mean. Statistics use ulab or numpy when available. Apply a
+    stable input, such as an unloaded cell, while sweeping."""
+
+    def __init__(
+        self,
+        nau7802,
+        samples=32,
+        gains=NAU7802.GAINS,
+        rates=NAU7802.RATES,
+        chopper=(0x0, 0x1, 0x2, 0x3),
+        ldo_modes=(0x0, 0x1),
+    ):
+        self.nau7802 = nau7802
+        self.samples = samples
+        self.gains = gains
+        self.rates = rates
+        self.chopper = chopper
+        self.ldo_modes = ldo_modes
+        self.results = []
+        self._values = array("i", bytes(4 * samples))
+        self._stamps = array("q", bytes(8 * samples))
+
+    def _measure(self, changed, timeout):
+        """Capture a block and return its statistics, or None on timeout."""
+        values = self._values
+        stamps = self._stamps
+        for i in range(self.samples):
+            raw = self.nau7802.read_next(timeout)
+            if raw is None:
+                return None
+            values[i] = raw
+            stamps[i] = time.monotonic_ns()
+        mean, rms, peak = _block_stats(values, self.samples // 2)
+        limit = 4 * rms + 1
+        settled = self.samples - 1
+        while settled > 0 and abs(values[settled - 1] - mean) <= limit:
+            settled -= 1
+        return {
+            "rms": rms,
+            "peak_to_peak": peak,
+            "enob": 24 - math.log(max(rms, 1e-3)) / math.log(2),
+            "settling": (stamps[settled] - changed) / 1_000_000_000,
+        }
+
+    def _point(self, timeout, **settings):
+        changed = time.monotonic_ns()
+        self.nau7802.read()  # Clear the data-ready flag
+        result = self._measure(changed, timeout)
+        if result is not None:
+            result.update(settings)
+            self.results.append(result)
+
+    def run(self, timeout=1.0):
+        """Sweep every combination and return the list of result
+        dictionaries. The original settings are restored afterwards."""
+        nau7802 = self.nau7802
+        original = (
+            nau7802.gain,
+            nau7802.poll_rate,
+            nau7802.chopper_clock,
+            nau7802.pga_ldo_mode,
+        )
+        self.results = []
+        try:
+            for ldo_mode in self.ldo_modes:
+                nau7802.pga_ldo_mode = ldo_mode
+                for chop in self.chopper:
+                    nau7802.chopper_clock = chop
+                    for rate in self.rates:
+                        for gain in self.gains:
+                            nau7802.apply(gain=gain, rate=rate)
+                            self._point(
+                                timeout, gain=gain, rate=rate, chopper=chop, ldo_mode=ldo_mode
+                            )
+        finally:
+            nau7802.apply(gain=original[0], rate=original[1])
+            nau7802.chopper_clock = original[2]
+            nau7802.pga_ldo_mode = original[3]
+        return self.results
+
+    def recommend(self, bandwidth):
+        """Return the result with the lowest input-referred noise once
+        averaged down to ``bandwidth`` Hz, considering only rates of at
+        least twice the bandwidth; None if no result qualifies."""
+        best = None
+        best_noise = None
+        for result in self.results:
+            if result["rate"] < 2 * bandwidth:
+                continue
+            averaged = result["rate"] / (2 * bandwidth)
+            noise = result["rms"] / result["gain"] / averaged**0.5
+            if best is None or noise < best_noise:
+                best = result
+                best_noise = noise
+        return best
+
+    def apply(self, result):
+        """Configure the device with the settings of a ``run()`` result."""
+        self.nau7802.apply(gain=result["gain"], rate=result["rate"])
+        self.nau7802.chopper_clock = result["chopper"]
+        self.nau7802.pga_ldo_mode = result["ldo_mode"]
@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 agent
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cedargrove_nau7802_recorder`
+================================================================================
+
+Block-buffered binary sample logging for the NAU7802 driver.
+
+
+* Author(s): agent
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* ``cedargrove_nau7802``
+"""
+
+import struct
+import time
+
+from cedargrove_nau7802 import CalibrationMode, LDOVoltage
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
+
+
+class SampleRecorder:
+    """Block-buffered binary sample log writer. The file starts with a
+    header holding the device address, gain, rate, LDO setting, last
+    calibration mode, host calibration offset and scale, and the start time.
+    Each sample is a fixed 9-byte little-endian record: time since the
+    previous record in microseconds (uint32), channel (uint8), raw 24-bit
+    value, and user flags (uint8). Records are packed into a preallocated
+    block of ``block`` records and written when the block fills."""
+
+    MAGIC = b"N7L1"
+    HEADER = "<4sBBHBBifQ"  # magic, address, gain, rate, ldo, cal mode, offset, scale, start
+    RECORD_SIZE = 9
+
+    def __init__(self, file, nau7802, block=64):
+        self.file = file
+        self.nau7802 = nau7802
+        self._block = bytearray(block * self.RECORD_SIZE)
+        self._pos = 0
+        self._last = time.monotonic_ns()
+        calibration = nau7802.calibration
+        mode = nau7802.calibration_mode
+        file.write(
+            struct.pack(
+                self.HEADER,
+                self.MAGIC,
+                nau7802.i2c_device.device_address,
+                nau7802.gain,
+                nau7802.poll_rate,
+                getattr(LDOVoltage, "LDO_" + nau7802.ldo_voltage),
+                0xFF if mode is None else getattr(CalibrationMode, mode),
+                calibration.offset,
+                calibration.scale,
+                self._last,
+            )
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.flush()
+        return False
+
+    def record(self, raw, channel=1, flags=0, stamp=None):
+        """Append one sample taken at ``stamp`` (``monotonic_ns``; defaults
+        to now)."""
+        if stamp is None:
+            stamp = time.monotonic_ns()
+        delta = min((stamp - self._last) // 1000, 0xFFFFFFFF)
+        self._last += delta * 1000  # Carry the sub-microsecond remainder
+        block = self._block
+        pos = self._pos
+        block[pos] = delta & 0xFF
+        block[pos + 1] = (delta >> 8) & 0xFF
+        block[pos + 2] = (delta >> 16) & 0xFF
+        block[pos + 3] = delta >> 24
+        block[pos + 4] = channel
+        block[pos + 5] = raw & 0xFF
+        block[pos + 6] = (raw >> 8) & 0xFF
+        block[pos + 7] = (raw >> 16) & 0xFF
+        block[pos + 8] = flags
+        self._pos = pos + self.RECORD_SIZE
+        if self._pos == len(self._block):
+            self.flush()
+
+    def capture(self, count, timeout=1.0):
+        """Record the next ``count`` conversions from the device. Returns
+        the number recorded, which is less than ``count`` on timeout."""
+        for i in range(count):
+            raw = self.nau7802.read_next(timeout)
+            if raw is None:
+                return i
+            self.record(raw, self.nau7802.channel)
+        return count
+
+    def flush(self):
+        """Write any buffered records to the file."""
+        if self._pos:
+            self.file.write(memoryview(self._block)[: self._pos])
+            self._pos = 0
+
+
+class SampleLogReader:
+    """Reader for logs written by ``SampleRecorder``. ``header`` holds the
+    decoded header fields. ``read_into()`` decodes records block by block
+    into caller-supplied arrays without allocating per record."""
+
+    def __init__(self, file, block=64):
+        self.file = file
+        size = struct.calcsize(SampleRecorder.HEADER)
+        fields = struct.unpack(SampleRecorder.HEADER, file.read(size))
+        if fields[0] != SampleRecorder.MAGIC:
+            raise ValueError("Invalid sample log")
+        self.header = {
+            "address": fields[1],
+            "gain": fields[2],
+            "rate": fields[3],
+            "ldo": fields[4],
+            "calibration_mode": None if fields[5] == 0xFF else fields[5],
+            "offset": fields[6],
+            "scale": fields[7],
+            "start": fields[8],
+        }
+        self._stamp = fields[8]
+        self._block = bytearray(block * SampleRecorder.RECORD_SIZE)
+        self._view = memoryview(self._block)
+
+    def read_into(self, stamps, channels, values, flags=None):
+        """Decode up to ``len(values)`` records. ``stamps`` receives absolute
+        ``monotonic_ns`` times (e.g. ``array('q')``), ``channels`` the
+        channel numbers, ``values`` the signed raw samples
+        (``array('i')``), and optional ``flags`` the record flags. Returns
+        the number of records decoded; 0 at the end of the log."""
+        record_size = SampleRecorder.RECORD_SIZE
+        block = self._block
+        count = 0
+        while count < len(values):
+            want = min(len(block), (len(values) - count) * record_size)
+            got = self.file.readinto(self._view[:want])
+            if not got:
+                break
+            for pos in range(0, got - got % record_size, record_size):
+                delta = (
+                    block[pos] | block[pos + 1] << 8 | block[pos + 2] << 16 | block[pos + 3] << 24
+                )
+                self._stamp += delta * 1000
+                raw = block[pos + 5] | block[pos + 6] << 8 | block[pos + 7] << 16
+                if raw & 0x800000:
+                    raw -= 0x1000000
+                stamps[count] = self._stamp
+                channels[count] = block[pos + 4]
+                values[count] = raw
+                if flags is not None:
+                    flags[count] = block[pos + 8]
+                count += 1
+        return count
@@ -0,0 +1,227 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 agent
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cedargrove_nau7802_stability`
+================================================================================
+
+Streaming settle detection and automatic zero tracking for the NAU7802
+driver.
+
+
+* Author(s): agent
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* ``cedargrove_nau7802``
+"""
+
+import time
+from array import array
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
+
+
+class Stabilizer:
+    """Streaming weight settle detector. Tracks the mean and variance of
+    the last ``window`` readings in O(1) per sample and reports a stable
+    reading once the standard deviation stays below ``threshold`` for
+    ``hold`` seconds. A reading further than ``spike`` from the mean of a
+    full window is rejected unless ``spike_count`` consecutive readings
+    agree, in which case it is treated as a new load. ``update()`` returns
+    an event name, or None, and calls ``callback(event, mean)`` if set:
+
+    * ``"settle"``: the reading became stable.
+    * ``"load_change"``: a stable mean moved by more than ``change``, or a
+      run of rejected spikes was accepted as a new load.
+    * ``"zero_drift"``: the reading settled within ``zero_band`` of
+      ``zero`` but more than ``drift`` away from it.
+    """
+
+    SETTLE = "settle"
+    LOAD_CHANGE = "load_change"
+    ZERO_DRIFT = "zero_drift"
+
+    def __init__(
+        self,
+        window=16,
+        threshold=100,
+        hold=0.5,
+        spike=None,
+        spike_count=3,
+        change=None,
+        zero=0,
+        zero_band=None,
+        drift=None,
+        callback=None,
+    ):
+        self._window = array("i", bytes(4 * window))
+        self._size = window
+        self.threshold = threshold
+        self.hold = hold
+        self.spike = spike
+        self.spike_count = spike_count
+        self.change = change if change is not None else 4 * threshold
+        self.zero = zero
+        self.zero_band = zero_band
+        self.drift = drift if drift is not None else threshold
+        self.callback = callback
+        self.rejected = 0  # Total readings rejected as spikes
+        self.reset()
+
+    def reset(self):
+        """Clear the window and the stable state."""
+        self._index = 0
+        self._count = 0
+        self._sum = 0
+        self._sum_sq = 0
+        self._quiet_since = None
+        self._spikes = 0
+        self.stable = False
+        self.stable_mean = None
+
+    @property
+    def mean(self):
+        """Mean of the readings in the window."""
+        return self._sum / self._count if self._count else 0
+
+    @property
+    def variance(self):
+        """Variance of the readings in the window. The integer sums are
+        combined exactly before the single division, avoiding cancellation
+        on single-precision floats."""
+        count = self._count
+        if not count:
+            return 0
+        return (count * self._sum_sq - self._sum * self._sum) / (count * count)
+
+    def _add(self, value):
+        if self._count < self._size:
+            self._count += 1
+        else:
+            old = self._window[self._index]
+            self._sum -= old
+            self._sum_sq -= old * old
+        self._window[self._index] = value
+        self._sum += value
+        self._sum_sq += value * value
+        self._index = (self._index + 1) % self._size
+
+    def update(self, value, stamp=None):
+        """Add a raw integer reading taken at ``stamp`` (``monotonic_ns``;
+        defaults to now) and return the resulting event, if any."""
+        if stamp is None:
+            stamp = time.monotonic_ns()
+        if (
+            self.spike is not None
+            and self._count == self._size
+            and abs(value - self.mean) > self.spike
+        ):
+            event = self._spike(value)
+        else:
+            self._spikes = 0
+            self._add(value)
+            event = self._check(stamp)
+        if event is not None and self.callback is not None:
+            self.callback(event, self.mean)
+        return event
+
+    def _spike(self, value):
+        """Reject an outlying reading, or restart on a new load after
+        ``spike_count`` consecutive outliers."""
+        self._spikes += 1
+        if self._spikes < self.spike_count:
+            self.rejected += 1
+            return None
+        was_stable = self.stable
+        self.reset()
+        self._add(value)
+        return self.LOAD_CHANGE if was_stable else None
+
+    def _check(self, stamp):
+        """Update the stable state after adding a reading."""
+        quiet = self._count == self._size and self.variance <= self.threshold**2
+        if not quiet:
+            self._quiet_since = None
+        elif self._quiet_since is None:
+            self._quiet_since = stamp
+        if self.stable:
+            if abs(self.mean - self.stable_mean) <= self.change:
+                return None
+            self.stable = quiet  # A quiet shift stays stable at the new mean
+            self.stable_mean = self.mean
+            return self.LOAD_CHANGE
+        if not quiet or stamp - self._quiet_since < self.hold * 1_000_000_000:
+            return None
+        self.stable = True
+        self.stable_mean = self.mean
+        offset = abs(self.stable_mean - self.zero)
+        if self.zero_band is not None and self.drift < offset <= self.zero_band:
+            return self.ZERO_DRIFT
+        return self.SETTLE
+
+
+class ZeroTracker:
+    """Incremental automatic zero tracking for a ``NAU7802`` fed from the
+    normal sample stream. While a reading is stable and within ``band``
+    counts of the selected channel's calibration offset, the offset is moved
+    toward it by at most ``step`` counts per sample. If the accumulated
+    drift exceeds ``limit`` counts and ``recalibrate`` is True, the chip's
+    offset calibration is run and the offset is re-tared from the average
+    of settled readings."""
+
+    def __init__(
+        self,
+        nau7802,
+        band=500,
+        step=1,
+        limit=20000,
+        window=16,
+        threshold=100,
+        hold=1.0,
+        recalibrate=True,
+    ):
+        self.nau7802 = nau7802
+        self.band = band
+        self.step = step
+        self.limit = limit
+        self.recalibrate = recalibrate
+        self.stabilizer = Stabilizer(window, threshold, hold)
+        self.base = nau7802.calibration.offset  # Offset at the last (re)zero
+        self.recalibrations = 0
+
+    @property
+    def drift(self):
+        """Offset change since the last chip calibration or ``rezero()``."""
+        return self.nau7802.calibration.offset - self.base
+
+    def rezero(self):
+        """Accept the current offset as the drift baseline."""
+        self.base = self.nau7802.calibration.offset
+
+    def update(self, raw, stamp=None):
+        """Add a raw reading; returns the offset adjustment made, in counts."""
+        stabilizer = self.stabilizer
+        stabilizer.update(raw, stamp)
+        calibration = self.nau7802.calibration
+        error = round(stabilizer.mean) - calibration.offset
+        if not stabilizer.stable or abs(error) > self.band:
+            return 0
+        adjust = max(-self.step, min(self.step, error))
+        calibration.offset += adjust
+        if self.recalibrate and abs(self.drift) > self.limit:
+            nau7802 = self.nau7802
+            nau7802.calibrate("OFFSET")
+            # Discard the conversions started before the calibration settled
+            for _ in range(nau7802.settle_discard):
+                nau7802.read_next()
+            nau7802.tare()
+            stabilizer.reset()
+            self.rezero()
+            self.recalibrations += 1
+        return adjust
@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 agent
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`cedargrove_nau7802_threaded`
+================================================================================
+
+Thread safety and thread pool fan-out of NAU7802 reads for CPython/Blinka
+hosts.
+
+
+* Author(s): agent
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* ``cedargrove_nau7802``
+* Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+"""
+
+try:
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    threading = None  # Threads are only available on CPython/Blinka hosts
+    ThreadPoolExecutor = None
+
+from adafruit_bus_device.i2c_device import I2CDevice
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/CedarGroveStudios/CircuitPython_NAU7802.git"
+
+# Per-bus locks shared by thread-safe devices, keyed by bus object id
+_BUS_LOCKS = {}
+
+
+class _LockedI2CDevice:
+    """I2CDevice wrapper that holds a shared per-bus re-entrant lock for
+    the duration of each ``with`` block, so a read-modify-write or other
+    grouped transfer is one uninterrupted bus operation across threads."""
+
+    def __init__(self, i2c_device, lock):
+        self.i2c_device = i2c_device
+        self.device_address = i2c_device.device_address
+        self._lock = lock
+        self._depth = 0
+
+    def __enter__(self):
+        self._lock.acquire()
+        if not self._depth:
+            self.i2c_device.__enter__()
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
+        if not self._depth:
+            self.i2c_device.__exit__(exc_type, exc_val, exc_tb)
+        self._lock.release()
+        return False
+
+    def readinto(self, buf, *, start=0, end=None):
+        """Read from the device into a buffer."""
+        with self:
+            self.i2c_device.readinto(buf, start=start, end=end)
+
+    def write(self, buf, *, start=0, end=None):
+        """Write a buffer to the device."""
+        with self:
+            self.i2c_device.write(buf, start=start, end=end)
+
+    def write_then_readinto(
+        self, out_buffer, in_buffer, *, out_start=0, out_end=None, in_start=0, in_end=None
+    ):
+        """Write then read with a repeated start."""
+        with self:
+            self.i2c_device.write_then_readinto(
+                out_buffer,
+                in_buffer,
+                out_start=out_start,
+                out_end=out_end,
+                in_start=in_start,
+                in_end=in_end,
+            )
+
+
+def thread_safe(nau7802, enable=True):
+    """Enable or disable thread safety for a NAU7802 device. Each device
+    gets a re-entrant lock covering whole logical operations such as a
+    channel switch and its ready wait, or a calibration start and poll. Bus
+    transfers are serialized by a lock shared by all devices on the same
+    bus, held only for each transfer, so one device's waits do not stall the
+    others. Returns True if thread safety is enabled."""
+    # Locate the I2CDevice beneath any shadow or instrumentation wrapper
+    holder = nau7802
+    while not isinstance(holder.i2c_device, (I2CDevice, _LockedI2CDevice)):
+        holder = holder.i2c_device
+    locked = isinstance(holder.i2c_device, _LockedI2CDevice)
+    if enable and not locked:
+        if threading is None:
+            raise RuntimeError("Threading is not supported")
+        bus = holder.i2c_device.i2c
+        lock = _BUS_LOCKS.get(id(bus))
+        if lock is None:
+            lock = _BUS_LOCKS[id(bus)] = threading.RLock()
+        holder.i2c_device = _LockedI2CDevice(holder.i2c_device, lock)
+        nau7802.lock = threading.RLock()
+    elif not enable and locked:
+        holder.i2c_device = holder.i2c_device.i2c_device
+        nau7802.lock = None
+    return enable
+
+
+class ThreadedReader:
+    """Fan sample reads out across several NAU7802 devices using a thread
+    pool; CPython/Blinka hosts only. Makes each device thread safe.
+    ``read_all()`` returns one ``concurrent.futures.Future`` per device
+    resolving to its next raw sample, or None on timeout."""
+
+    def __init__(self, devices, max_workers=None):
+        if ThreadPoolExecutor is None:
+            raise RuntimeError("Threading is not supported")
+        self.devices = list(devices)
+        for dev in self.devices:
+            thread_safe(dev)
+        self._executor = ThreadPoolExecutor(max_workers or len(self.devices))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def submit(self, device, method, *args):
+        """Run ``device.method(*args)`` on the pool and return its future."""
+        return self._executor.submit(getattr(device, method), *args)
+
+    def read_all(self, timeout=1.0):
+        """Request the next sample from every device."""
+        return [self.submit(dev, "read_next", timeout) for dev in self.devices]
+
+    def close(self):
+        """Shut down the thread pool."""
+        self._executor.shutdown()
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+"""
+nau7802_benchmark.py  Cedar Grove Maker Studios
+
+Measures the driver's hot paths against the simulated NAU7802 in
+``nau7802_simulator.py``; no hardware is required. Reports I2C
+transactions, bytes moved, wall-clock time, and bytes allocated per
+operation for startup, read(), read_samples(), channel switching, and
+calibrate(). Run with ``--check`` to exit with an error when a hot path
+exceeds its I2C transaction budget, e.g. in CI.
+"""
+
+import gc
+import sys
+import time
+from array import array
+
+from nau7802_simulator import SimulatedI2C, SimulatedNAU7802
+
+from cedargrove_nau7802 import NAU7802
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None  # CircuitPython; use gc.mem_free() instead
+
+# Maximum I2C transactions per operation for --check
+BUDGETS = {
+    "startup": 40,
+    "read": 1,
+    "read_samples": 4,
+    "channel": 12,
+    "calibrate": 16,
+}
+
+
+def _allocated(operation, count):
+    """Return the mean bytes allocated per call of ``operation``. On
+    CPython each call's traced peak above the memory in use before it is
+    summed, so allocations freed within the call are still counted."""
+    gc.collect()
+    if tracemalloc:
+        tracemalloc.start()
+        total = 0
+        for _ in range(count):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            operation()
+            total += tracemalloc.get_traced_memory()[1] - before
+        tracemalloc.stop()
+        return total / count
+    gc.disable()
+    start = gc.mem_free()
+    for _ in range(count):
+        operation()
+    used = start - gc.mem_free()
+    gc.enable()
+    return used / count
+
+
+def measure(bus, label, operation, count):
+    """Run ``operation`` ``count`` times and return a result dictionary.
+    Allocations are measured in a separate pass so that tracing does not
+    distort the timing."""
+    bus.reset_counters()
+    start = time.monotonic_ns()
+    for _ in range(count):
+        operation()
+    elapsed = time.monotonic_ns() - start
+    result = {
+        "label": label,
+        "transactions": bus.transactions / count,
+        "bytes": (bus.bytes_written + bus.bytes_read) / count,
+        "usec": elapsed / count / 1000,
+    }
+    result["alloc"] = _allocated(operation, count)
+    return result
+
+
+def run(count=50):
+    """Run all benchmarks and return the list of results."""
+    bus = SimulatedI2C({0x2A: SimulatedNAU7802(waveform=lambda seconds, channel: 1000 * channel)})
+    results = [measure(bus, "startup", lambda: NAU7802(bus, active_channels=2), 1)]
+
+    nau7802 = NAU7802(bus, active_channels=2)
+    nau7802.poll_rate = 320
+    results.append(measure(bus, "read", nau7802.read, count))
+
+    samples = array("i", bytes(4 * count))
+    result = measure(bus, "read_samples", lambda: nau7802.read_samples(count, samples), 1)
+    for key in ("transactions", "bytes", "usec", "alloc"):
+        result[key] /= count
+    results.append(result)
+
+    def switch_channel():
+        nau7802.channel = 2 if nau7802.channel == 1 else 1
+
+    results.append(measure(bus, "channel", switch_channel, count // 5))
+    results.append(measure(bus, "calibrate", lambda: nau7802.calibrate("INTERNAL"), 5))
+    return results
+
+
+def main():
+    """Print the benchmark table and optionally check transaction budgets."""
+    results = run()
+    print(f"{'operation':14s}{'I2C tx':>10s}{'bytes':>10s}{'usec':>12s}{'alloc B':>10s}")
+    failed = False
+    for result in results:
+        print(
+            f"{result['label']:14s}{result['transactions']:10.1f}{result['bytes']:10.1f}"
+            f"{result['usec']:12.1f}{result['alloc']:10.1f}"
+        )
+        if result["transactions"] > BUDGETS[result["label"]]:
+            failed = True
+            print(f"  over budget: {BUDGETS[result['label']]} transactions")
+    if "--check" in sys.argv and failed:
+        sys.exit(1)
+
+
+main()
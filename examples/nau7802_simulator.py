@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: 2026 Cedar Grove Maker Studios
+# SPDX-License-Identifier: MIT
+
+"""
+nau7802_simulator.py  Cedar Grove Maker Studios
+
+A register-level software model of the NAU7802 and a simulated I2C bus
+that can be passed to ``NAU7802`` in place of ``board.I2C()``. Used by
+``nau7802_benchmark.py`` to exercise the driver without hardware.
+
+Modeled behavior:
+  PU_CTRL: register reset (RR), digital/analog power-up (PUD/PUA), power-up
+    ready (PUR) after a short delay, conversion start (CS), and cycle ready
+    (CR) set on each completed conversion and cleared by reading ADCO_B0.
+  CTRL1/CTRL2: all fields stored; the conversion rate (CRS) and channel
+    select (CHS) restart the conversion cycle.
+  ADCO_B2..B0: latched result of ``waveform(seconds, channel)`` at the
+    configured conversion rate, with register auto-increment.
+  Calibration: CALS clears after ``calibration_conversions`` periods and
+    CAL_ERR is set if ``cal_error`` is True; otherwise the current input is
+    stored in the selected channel's OCAL register bank.
+"""
+
+import time
+
+_RATE_SPS = {0x0: 10, 0x1: 20, 0x2: 40, 0x3: 80, 0x7: 320}
+
+
+def constant_waveform(value=0):
+    """Return a waveform function producing ``value`` on both channels."""
+    return lambda seconds, channel: value
+
+
+class SimulatedNAU7802:
+    """Software model of the NAU7802 register map."""
+
+    def __init__(self, waveform=None, power_up_time=0.0002, calibration_conversions=2):
+        self.waveform = waveform or constant_waveform(0)
+        self.power_up_time = power_up_time
+        self.calibration_conversions = calibration_conversions
+        self.cal_error = False
+        self.regs = bytearray(0x20)
+        self.adc_ctrl = 0  # Write-only ADC register shares 0x15 with OTP_B1
+        self._pointer = 0
+        self._reset()
+
+    def _reset(self):
+        for reg in range(len(self.regs)):
+            self.regs[reg] = 0
+        self.regs[0x1F] = 0x0F  # REV_ID
+        self.adc_ctrl = 0
+        self._pud_time = None
+        self._cal_done = None
+        self._restart(time.monotonic_ns())
+
+    def _restart(self, now):
+        self._cycle_start = now
+        self._conversions = 0
+
+    @property
+    def rate(self):
+        """Conversion rate in samples per second from CTRL2[6:4]."""
+        return _RATE_SPS.get((self.regs[0x02] >> 4) & 0x7, 10)
+
+    @property
+    def channel(self):
+        """Selected channel number from CTRL2[7]."""
+        return 2 if self.regs[0x02] & 0x80 else 1
+
+    def _update(self):
+        now = time.monotonic_ns()
+        pu_ctrl = self.regs[0x00]
+        if pu_ctrl & 0x02 and self._pud_time is not None:
+            if now - self._pud_time >= self.power_up_time * 1_000_000_000:
+                self.regs[0x00] |= 0x08  # PUR
+        else:
+            self.regs[0x00] &= ~0x08 & 0xFF
+        if self._cal_done is not None and now >= self._cal_done:
+            self._cal_done = None
+            self.regs[0x02] &= ~0x04 & 0xFF  # CALS cleared on completion
+            if self.cal_error:
+                self.regs[0x02] |= 0x08  # CAL_ERR
+            else:
+                # Store the offset result in the channel's OCAL register bank
+                value = int(self.waveform(now / 1_000_000_000, self.channel)) & 0xFFFFFF
+                bank = 0x03 if self.channel == 1 else 0x0A
+                self.regs[bank : bank + 3] = value.to_bytes(3, "big")
+        running = pu_ctrl & 0x16 == 0x16 and self.regs[0x00] & 0x08  # PUD, PUA, CS
+        if not running or self._cal_done is not None:
+            self._restart(now)
+            return
+        period = 1_000_000_000 // self.rate
+        completed = (now - self._cycle_start) // period
+        if completed > self._conversions:
+            self._conversions = completed
+            stamp = (self._cycle_start + completed * period) / 1_000_000_000
+            value = int(self.waveform(stamp, self.channel))
+            value = max(-0x800000, min(0x7FFFFF, value)) & 0xFFFFFF
+            self.regs[0x12] = value >> 16
+            self.regs[0x13] = (value >> 8) & 0xFF
+            self.regs[0x14] = value & 0xFF
+            self.regs[0x00] |= 0x20  # CR
+
+    def write(self, data):
+        """Handle an I2C write: register pointer followed by data bytes."""
+        if not data:
+            return
+        self._update()
+        self._pointer = data[0]
+        for value in data[1:]:
+            self._write_register(self._pointer, value)
+            self._pointer = (self._pointer + 1) & 0x1F
+
+    def _write_register(self, reg, value):
+        now = time.monotonic_ns()
+        old = self.regs[reg]
+        if reg == 0x00:
+            if value & 0x01:
+                self._reset()
+                self.regs[0x00] = 0x01
+                return
+            if value & 0x02 and not old & 0x02:
+                self._pud_time = now
+            value = (value & ~0x28 & 0xFF) | (old & 0x28)  # PUR and CR are read-only
+            if not value & 0x02:
+                self._pud_time = None
+                value &= ~0x08 & 0xFF
+        elif reg == 0x02:
+            if value & 0x04 and not old & 0x04:
+                period = 1_000_000_000 // _RATE_SPS.get((value >> 4) & 0x7, 10)
+                self._cal_done = now + self.calibration_conversions * period
+                value &= ~0x08 & 0xFF
+            if (value ^ old) & 0xF0:
+                self._restart(now)
+        elif reg == 0x15:
+            self.adc_ctrl = value
+            return
+        elif reg in {0x12, 0x13, 0x14, 0x16, 0x1F}:
+            return  # Read-only
+        self.regs[reg] = value
+
+    def read(self, count):
+        """Handle an I2C read of ``count`` bytes from the register pointer."""
+        self._update()
+        data = bytearray(count)
+        for i in range(count):
+            reg = self._pointer
+            data[i] = 0 if reg == 0x15 else self.regs[reg]
+            if reg == 0x14:
+                self.regs[0x00] &= ~0x20 & 0xFF  # Reading the result clears CR
+            self._pointer = (self._pointer + 1) & 0x1F
+        return data
+
+
+class SimulatedI2C:
+    """A ``busio.I2C``-compatible bus hosting simulated devices. Counts
+    transactions and bytes moved."""
+
+    def __init__(self, devices=None):
+        self.devices = devices if devices is not None else {0x2A: SimulatedNAU7802()}
+        self.locked = False
+        self.reset_counters()
+
+    def reset_counters(self):
+        """Zero the transaction and byte counters."""
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    def try_lock(self):
+        """Lock the bus; always succeeds as the simulated bus is not shared."""
+        self.locked = True
+        return True
+
+    def unlock(self):
+        """Release the bus lock."""
+        self.locked = False
+
+    def scan(self):
+        """List the addresses of the simulated devices."""
+        return sorted(self.devices)
+
+    def _device(self, address):
+        if address not in self.devices:
+            raise OSError(19, "No such device")
+        return self.devices[address]
+
+    def writeto(self, address, buffer, *, start=0, end=None):
+        """Write ``buffer[start:end]`` to a device."""
+        data = bytes(buffer[start:end])
+        self._device(address).write(data)
+        self.transactions += 1
+        self.bytes_written += len(data)
+
+    def readfrom_into(self, address, buffer, *, start=0, end=None):
+        """Read from a device into ``buffer[start:end]``."""
+        end = len(buffer) if end is None else end
+        buffer[start:end] = self._device(address).read(end - start)
+        self.transactions += 1
+        self.bytes_read += end - start
+
+    def writeto_then_readfrom(
+        self,
+        address,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start=0,
+        out_end=None,
+        in_start=0,
+        in_end=None,
+    ):
+        """Write then read with a repeated start; one transaction."""
+        device = self._device(address)
+        data = bytes(out_buffer[out_start:out_end])
+        in_end = len(in_buffer) if in_end is None else in_end
+        device.write(data)
+        in_buffer[in_start:in_end] = device.read(in_end - in_start)
+        self.transactions += 1
+        self.bytes_written += len(data)
+        self.bytes_read += in_end - in_start